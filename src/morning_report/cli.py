@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import subprocess
 import sys
@@ -88,9 +87,9 @@ def gather(
     for name in names:
         cls = _GATHERER_CLASSES[name]
         gatherer_config = cfg.get(name, {})
-        gatherer = cls(config=gatherer_config)
         typer.echo(f"Gathering: {name}...")
-        results[name] = gatherer.safe_gather()
+        with cls(config=gatherer_config) as gatherer:
+            results[name] = gatherer.safe_gather()
         status = results[name].get("status", "unknown")
         if status == "ok":
             typer.echo(f"  {name}: OK")
@@ -139,8 +138,8 @@ def show(
         )
         raise typer.Exit(1)
 
-    with open(json_path) as f:
-        data = json.load(f)
+    from morning_report import jsonio
+    data = jsonio.load_file(json_path)
 
     # Generate French content via API
     french_content = _generate_french(data, cfg, date=report_date)
@@ -163,9 +162,10 @@ def export(
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
 ):
-    """Export the markdown report to a Word document (.docx) via pandoc."""
+    """Export the markdown report to a Word document (.docx)."""
     _setup_logging(verbose)
 
+    cfg = load_config(config_path)
     date_str = date or datetime.now().strftime("%Y-%m-%d")
     briefings_dir = get_project_root() / "briefings"
     md_path = briefings_dir / f"{date_str}.md"
@@ -178,7 +178,11 @@ def export(
         raise typer.Exit(1)
 
     from morning_report.report.exporter import export_docx
-    docx_path = export_docx(md_path)
+    try:
+        docx_path = export_docx(md_path, engine=cfg.get("export", {}).get("engine", "pandoc"))
+    except (RuntimeError, FileNotFoundError, OSError, ValueError) as e:
+        typer.echo(f"Export failed: {e}", err=True)
+        raise typer.Exit(1) from None
     typer.echo(f"Exported: {docx_path}")
 
 
@@ -279,9 +283,9 @@ def auto(
     results = {}
     for name, cls in _GATHERER_CLASSES.items():
         gatherer_config = cfg.get(name, {})
-        gatherer = cls(config=gatherer_config)
         typer.echo(f"  Gathering: {name}...")
-        results[name] = gatherer.safe_gather()
+        with cls(config=gatherer_config) as gatherer:
+            results[name] = gatherer.safe_gather()
         status = results[name].get("status", "unknown")
         if status == "ok":
             typer.echo(f"    {name}: OK")
@@ -309,9 +313,9 @@ def auto(
     docx_path = None
     try:
         from morning_report.report.exporter import export_docx
-        docx_path = export_docx(md_path)
+        docx_path = export_docx(md_path, engine=cfg.get("export", {}).get("engine", "pandoc"))
         typer.echo(f"  Exported: {docx_path}")
-    except (RuntimeError, FileNotFoundError, OSError) as e:
+    except (RuntimeError, FileNotFoundError, OSError, ValueError) as e:
         typer.echo(f"  Export failed: {e}", err=True)
         typer.echo("  Report is still available as markdown.")
 
@@ -332,6 +336,7 @@ def auto(
                 json_path=json_path,
                 recipient=email_cfg.get("recipient", "snlongmore@gmail.com"),
                 sender=email_cfg.get("sender", "snlongmore@gmail.com"),
+                data=results,
             )
             typer.echo(f"  Report emailed to {email_cfg.get('recipient', 'snlongmore@gmail.com')}")
         except ValueError as e:
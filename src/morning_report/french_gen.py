@@ -16,12 +16,18 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import subprocess
 from datetime import datetime
 from typing import Any
 
+from morning_report import jsonio
+
 logger = logging.getLogger(__name__)
 
+# First fenced block (any info string); an unclosed fence runs to the end
+_CODE_BLOCK_RE = re.compile(r"^[ \t]*```[^\n]*\n(.*?)(?:^[ \t]*```|\Z)", re.MULTILINE | re.DOTALL)
+
 _DEFAULT_MODEL_CLI = "opus"             # model alias for claude -p
 _DEFAULT_MODEL_API = "claude-sonnet-4-6" # full model ID for anthropic SDK
 _MAX_TOKENS = 4096
@@ -108,47 +114,59 @@ def _extract_json(text: str) -> dict[str, Any]:
 
     # Try direct parse first
     try:
-        return json.loads(text)
+        return jsonio.loads(text)
     except json.JSONDecodeError:
         pass
 
     # Try extracting from markdown code block
-    if "```" in text:
-        lines = text.split("\n")
-        in_block = False
-        block_lines: list[str] = []
-        for line in lines:
-            if line.strip().startswith("```") and not in_block:
-                in_block = True
-                continue
-            elif line.strip().startswith("```") and in_block:
-                break
-            elif in_block:
-                block_lines.append(line)
-        if block_lines:
-            try:
-                return json.loads("\n".join(block_lines))
-            except json.JSONDecodeError:
-                pass
+    match = _CODE_BLOCK_RE.search(text)
+    if match and match.group(1):
+        try:
+            return jsonio.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
 
     # Fallback: return raw text as meditation_fr
     logger.warning("Could not parse JSON from API response, using raw text as meditation_fr")
     return {"meditation_fr": text, "_parse_error": True}
 
 
+def _first_current(weather_data: dict) -> tuple[str, dict] | None:
+    """Return ``(location, current)`` for the first location with current conditions."""
+    return next(
+        (
+            (loc_name, current)
+            for loc_name, loc_data in weather_data.get("locations", {}).items()
+            if (current := loc_data.get("current"))
+        ),
+        None,
+    )
+
+
 def _weather_summary(weather_data: dict) -> str:
     """Build a one-line weather summary from gathered data."""
     if weather_data.get("status") != "ok":
         return "Weather data unavailable."
 
-    for loc_name, loc_data in weather_data.get("locations", {}).items():
-        current = loc_data.get("current", {})
-        if current:
-            desc = current.get("description", "")
-            temp = current.get("temp", "")
-            return f"{loc_name}: {desc}, {temp}°C"
+    first = _first_current(weather_data)
+    if first is None:
+        return "Weather data unavailable."
+    loc_name, current = first
+    return f"{loc_name}: {current.get('description', '')}, {current.get('temp', '')}°C"
+
+
+def _format_price(price: float) -> str:
+    """Format a USD price: whole dollars from $100 up, four decimals below."""
+    return f"${price:,.0f}" if price >= 100 else f"${price:.4f}"
 
-    return "Weather data unavailable."
+
+def _crypto_parts(crypto: dict) -> list[str]:
+    """Format each coin with a known price as ``"SYMBOL $price"``."""
+    return [
+        f"{coin_data.get('symbol', coin_id).upper()} {_format_price(coin_data['price_usd'])}"
+        for coin_id, coin_data in crypto.items()
+        if coin_data.get("price_usd") is not None
+    ]
 
 
 def _markets_summary(markets_data: dict) -> str:
@@ -156,16 +174,7 @@ def _markets_summary(markets_data: dict) -> str:
     if markets_data.get("status") != "ok":
         return "Markets data unavailable."
 
-    parts: list[str] = []
-    for coin_id, coin_data in markets_data.get("crypto", {}).items():
-        price = coin_data.get("price_usd")
-        symbol = coin_data.get("symbol", coin_id).upper()
-        if price is not None:
-            if price >= 100:
-                parts.append(f"{symbol} ${price:,.0f}")
-            else:
-                parts.append(f"{symbol} ${price:.4f}")
-
+    parts = _crypto_parts(markets_data.get("crypto", {}))
     return ", ".join(parts) if parts else "Markets data unavailable."
 
 
@@ -237,7 +246,7 @@ def _generate_via_claude_code(
 
     # Parse the CLI JSON envelope → extract the "result" field
     try:
-        envelope = json.loads(proc.stdout)
+        envelope = jsonio.loads(proc.stdout)
     except (json.JSONDecodeError, TypeError) as e:
         logger.error("Failed to parse claude CLI JSON output: %s", e)
         return {key: _FALLBACK_MSG for key in _EXPECTED_KEYS} | {
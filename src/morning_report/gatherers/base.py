@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Self
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +40,18 @@ class BaseGatherer(ABC):
         """
         return True
 
+    def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release any resources (sessions, connections) held by the gatherer.
+
+        Override in subclasses that hold any. Default: nothing to release.
+        """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def safe_gather(self) -> dict[str, Any]:
         """Run gather() with error handling. Always returns a valid dict."""
         if not self.is_available():
@@ -2,77 +2,315 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from morning_report import jsonio
 from morning_report.gatherers.base import BaseGatherer
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 logger = logging.getLogger(__name__)
 
 _OWM_BASE = "https://api.openweathermap.org/data/2.5"
 
-# Well-known coordinates for configured locations
-_KNOWN_COORDS = {
+_OWM_ONE_CALL = "https://api.openweathermap.org/data/3.0/onecall"
+
+_OWM_URLS = MappingProxyType({
+    "weather": f"{_OWM_BASE}/weather",
+    "forecast": f"{_OWM_BASE}/forecast",
+    "onecall": _OWM_ONE_CALL,
+})
+
+# 3-hour forecast steps covering the next 24h
+_FORECAST_ENTRIES = 8
+
+# Upper bound on concurrent OWM requests (two per location)
+_MAX_WORKERS = 8
+
+# Well-known coordinates for configured locations, keyed by _location_key()
+_KNOWN_COORDS = MappingProxyType({
     "west kirby, uk": (53.3726, -3.1836),
     "west kirby": (53.3726, -3.1836),
     "liverpool, uk": (53.4084, -2.9916),
     "london, uk": (51.5074, -0.1278),
-}
+})
+
+
+class _CoordsCache:
+    """Persistent ``location -> (lat, lon)`` cache in SQLite, shared across runs.
+
+    Filled from the ``coord`` field of OpenWeatherMap responses, so locations
+    missing from ``_KNOWN_COORDS`` still resolve on later runs. Any SQLite or
+    filesystem error degrades to a cache miss.
+    """
+
+    _path = Path.home() / ".cache" / "morning-report" / "geocode.db"
+
+    def __init__(self, path: Path | None = None):
+        self._db_path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self._db_path or self._path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> tuple[float, float] | None:
+        with self._lock:
+            try:
+                row = self._connection().execute(
+                    "SELECT lat, lon FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            except (sqlite3.Error, OSError) as e:
+                logger.debug("Geocode cache unavailable: %s", e)
+                return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, lat: float, lon: float) -> None:
+        with self._lock:
+            try:
+                with self._connection() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, lat, lon, ts) VALUES (?, ?, ?, ?)",
+                        (key, lat, lon, int(time.time())),
+                    )
+            except (sqlite3.Error, OSError) as e:
+                logger.debug("Could not write geocode cache: %s", e)
+
+
+_COORDS_CACHE = _CoordsCache()
+
+
+def _location_key(location: str) -> str:
+    """Normalise a configured location name for coordinate lookups.
+
+    ``casefold`` rather than ``lower`` so names such as "İstanbul" or
+    "Straße" match however they are capitalised.
+    """
+    return location.strip().casefold()
 
 
 def _get_coords(location: str) -> tuple[float, float] | None:
-    """Look up coordinates for a location name."""
-    key = location.lower().strip()
-    return _KNOWN_COORDS.get(key)
+    """Look up coordinates for a location name.
+
+    Checks the built-in table first, then the on-disk cache of coordinates
+    seen in earlier API responses.
+    """
+    return _lookup_coords(_location_key(location))
+
+
+@functools.lru_cache(maxsize=512)
+def _lookup_coords(key: str) -> tuple[float, float] | None:
+    """Resolve a normalised location key, memoised (misses included).
+
+    :func:`_remember_coords` clears the memo when it learns a new location.
+    """
+    return _KNOWN_COORDS.get(key) or _COORDS_CACHE.get(key)
+
+
+def _remember_coords(location: str, response: dict[str, Any]) -> None:
+    """Cache the coordinates OWM reports for *location* if we don't know them yet."""
+    coord = response.get("coord")
+    if not coord or "lat" not in coord or "lon" not in coord:
+        return
+    if _get_coords(location) is None:
+        _COORDS_CACHE.put(_location_key(location), coord["lat"], coord["lon"])
+        _lookup_coords.cache_clear()
+
+
+def _description(item: dict[str, Any]) -> str:
+    """The first ``weather[].description`` of an OWM item, or ``""``."""
+    return item["weather"][0]["description"] if item.get("weather") else ""
+
+
+def _one_call_current(current: dict[str, Any]) -> dict[str, Any]:
+    """Map One Call ``current`` onto the same fields as the 2.5 current-weather path."""
+    return {
+        "description": _description(current),
+        "temp": current.get("temp"),
+        "feels_like": current.get("feels_like"),
+        "humidity": current.get("humidity"),
+        "wind_speed": current.get("wind_speed"),
+    }
+
+
+def _one_call_forecast(hourly: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Every third hourly entry for the next 24h, matching the 2.5 3-hour forecast."""
+    return [
+        {
+            "time": datetime.fromtimestamp(item["dt"], UTC).strftime("%Y-%m-%d %H:%M:%S"),
+            "description": _description(item),
+            "temp": item.get("temp"),
+        }
+        for item in hourly[:24:3]
+    ]
+
+
+# Cached OWM responses (requests-cache): fresh for 10 minutes, then still
+# served for up to an hour if OWM is failing
+_RESPONSE_CACHE_PATH = Path.home() / ".cache" / "morning-report" / "owm"
+_RESPONSE_FRESH_SECONDS = 600
+_RESPONSE_STALE_SECONDS = 3600
+
+
+def _owm_session() -> requests.Session:
+    """HTTP session for OWM: pooled keep-alive connections, retrying brief 5xx outages.
+
+    When ``requests-cache`` is installed the session also caches responses
+    on disk, so reruns within a few minutes don't hit the API and an OWM
+    outage serves the last good data instead of an error.
+    """
+    if requests_cache is None:
+        session = requests.Session()
+    else:
+        _RESPONSE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(_RESPONSE_CACHE_PATH),
+            backend="sqlite",
+            expire_after=_RESPONSE_FRESH_SECONDS,
+            stale_if_error=_RESPONSE_STALE_SECONDS,
+            allowable_methods=("GET",),
+            # Keep the API key out of the stored requests and the cache keys
+            ignored_parameters=["appid"],
+        )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=_MAX_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    return session
 
 
 class WeatherGatherer(BaseGatherer):
-    """Gathers weather data from OpenWeatherMap."""
+    """Gathers weather data from OpenWeatherMap.
+
+    Requests share one pooled session, so connections (and their TLS
+    handshakes) are reused across locations and endpoints. The session is
+    created on first use; call :meth:`close`, or use the gatherer as a
+    context manager, to release it.
+    """
 
     def __init__(self, config: dict[str, Any] | None = None):
         self._config = config or {}
         self._api_key = self._config.get("api_key", "")
+        self._base_params = {"appid": self._api_key, "units": "metric"}
+        # An unexpanded ${VAR} placeholder means the key was never set
+        self._available = bool(self._api_key) and not self._api_key.startswith("${")
         self._locations = self._config.get("locations", ["West Kirby, UK"])
+        # One Call 3.0 needs its own OWM subscription, so it is opt-in
+        self._one_call = bool(self._config.get("one_call", False))
+        self._include_forecast = bool(self._config.get("include_forecast", True))
+
+    @functools.cached_property
+    def _session(self) -> requests.Session:
+        return _owm_session()
+
+    def close(self) -> None:
+        session = self.__dict__.pop("_session", None)
+        if session is not None:
+            session.close()
 
     @property
     def name(self) -> str:
         return "weather"
 
     def is_available(self) -> bool:
-        key = self._api_key
-        if key.startswith("${"):
-            return False
-        return bool(key)
+        return self._available
+
+    def _endpoints(self, location: str) -> tuple[str, ...]:
+        """Requests needed for a location: One Call when enabled and coordinates are known."""
+        if self._one_call and _get_coords(location) is not None:
+            return ("onecall",)
+        return ("weather", "forecast") if self._include_forecast else ("weather",)
+
+    def _fetch(self, session: requests.Session, endpoint: str, location: str) -> dict[str, Any]:
+        """GET one OWM endpoint (``weather``, ``forecast`` or ``onecall``) for a location."""
+        if endpoint == "onecall":
+            lat, lon = _get_coords(location)
+            exclude = "minutely,daily,alerts"
+            if not self._include_forecast:
+                exclude += ",hourly"
+            params = {**self._base_params, "lat": lat, "lon": lon, "exclude": exclude}
+        else:
+            params = {**self._base_params, "q": location}
+            if endpoint == "forecast":
+                # Only the next 24h is used; have OWM send 8 entries instead of 40
+                params["cnt"] = _FORECAST_ENTRIES
+        resp = session.get(_OWM_URLS[endpoint], params=params, timeout=10)
+        resp.raise_for_status()
+        # Parse the raw body ourselves so orjson is used when installed
+        return jsonio.loads(resp.content)
 
     def gather(self) -> dict[str, Any]:
-        """Fetch current weather and forecast for configured locations."""
+        """Fetch current weather and forecast for configured locations.
+
+        Every location's requests are issued concurrently (network-bound);
+        results keep the order of the configured locations. A location listed
+        more than once is only fetched once.
+        """
         forecasts: dict[str, Any] = {}
+        locations = list(dict.fromkeys(self._locations))
+        tasks = [(location, endpoint) for location in locations
+                 for endpoint in self._endpoints(location)]
+        if not tasks:
+            return {"locations": forecasts}
+
+        # Resolve the lazy session here: cached_property doesn't lock, so
+        # workers racing on first access would each build their own
+        session = self._session
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(tasks))) as pool:
+            futures = {task: pool.submit(self._fetch, session, task[1], task[0]) for task in tasks}
 
-        for location in self._locations:
-            params: dict[str, Any] = {
-                "appid": self._api_key,
-                "units": "metric",
-                "q": location,
-            }
+        for location in locations:
+            # One Call: current conditions and hourly forecast in one response
+            if (location, "onecall") in futures:
+                try:
+                    data = futures[location, "onecall"].result()
+                    forecasts[location] = {"current": _one_call_current(data["current"])}
+                    if self._include_forecast:
+                        forecasts[location]["forecast"] = _one_call_forecast(data.get("hourly", []))
+                except Exception as e:
+                    logger.warning("Failed to fetch weather for %s: %s", location, e)
+                    forecasts[location] = {"error": str(e)}
+                continue
 
             # Current weather
             try:
-                resp = requests.get(
-                    f"{_OWM_BASE}/weather",
-                    params=params,
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                current = resp.json()
-
-                weather_desc = current["weather"][0]["description"] if current.get("weather") else ""
+                current = futures[location, "weather"].result()
+                if self._one_call:
+                    # Only the One Call path reads learned coordinates
+                    _remember_coords(location, current)
+
                 main = current.get("main", {})
 
                 forecasts[location] = {
                     "current": {
-                        "description": weather_desc,
+                        "description": _description(current),
                         "temp": main.get("temp"),
                         "feels_like": main.get("feels_like"),
                         "humidity": main.get("humidity"),
@@ -85,21 +323,16 @@ class WeatherGatherer(BaseGatherer):
                 continue
 
             # 3-hour forecast (next 24h = 8 entries)
+            if not self._include_forecast:
+                continue
             try:
-                resp = requests.get(
-                    f"{_OWM_BASE}/forecast",
-                    params=params,
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                forecast_data = resp.json()
+                forecast_data = futures[location, "forecast"].result()
 
                 forecast_items = []
-                for item in forecast_data.get("list", [])[:8]:
-                    weather_desc = item["weather"][0]["description"] if item.get("weather") else ""
+                for item in forecast_data.get("list", [])[:_FORECAST_ENTRIES]:
                     forecast_items.append({
                         "time": item.get("dt_txt", ""),
-                        "description": weather_desc,
+                        "description": _description(item),
                         "temp": item.get("main", {}).get("temp"),
                     })
 
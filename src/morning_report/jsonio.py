@@ -0,0 +1,75 @@
+"""JSON encoding helpers with an optional ``orjson`` fast path.
+
+``orjson`` is an optional dependency (``uv pip install -e ".[fast]"``). When it
+is not installed, the stdlib ``json`` module is used and produces equivalent
+output, so callers never need to care which backend is active.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+from datetime import date, time
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode values JSON can't represent: ISO 8601 for dates/times, else ``str()``."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialise data to indented UTF-8 JSON bytes.
+
+    Dates, times and datetimes are written in ISO 8601 (natively in C by
+    ``orjson``, via ``.isoformat()`` in the fallback); any other value that is
+    not JSON-serialisable is converted with ``str()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, default=_default, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (``orjson``'s
+            decode error is a subclass, so one ``except`` covers both backends).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Parse a JSON file.
+
+    With ``orjson`` the file is memory-mapped and parsed straight from the
+    page cache, so there is no intermediate ``bytes`` copy of the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is empty or not valid JSON.
+    """
+    if orjson is None:
+        return json.loads(Path(path).read_bytes())
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return orjson.loads(b"")
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
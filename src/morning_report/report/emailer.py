@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import binascii
+import ctypes
+import functools
 import json
 import logging
+import mmap
 import smtplib
 import subprocess
-from datetime import datetime
-from email.message import EmailMessage
+import time
+from contextlib import ExitStack
+from datetime import date, datetime
+from email.message import EmailMessage, MIMEPart
 from pathlib import Path
+from typing import BinaryIO, Self
+
+from morning_report import jsonio
+from morning_report.french_gen import _crypto_parts, _first_current
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
@@ -17,16 +32,119 @@ SMTP_PORT = 587
 
 KEYCHAIN_SERVICE = "morning-report-gmail"
 
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+_B64_LINE_BYTES = 57  # raw bytes per 76-character base64 line (RFC 2045)
+
+_SECURITY_FRAMEWORK = "/System/Library/Frameworks/Security.framework/Security"
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_ERR_SEC_ITEM_NOT_FOUND = -25300
+
+
+@functools.cache
+def _security_lib() -> tuple[ctypes.CDLL, ctypes.CDLL] | None:
+    """Load Security.framework (and CoreFoundation) via ctypes.
+
+    Calling the Keychain API directly avoids forking the ``security`` CLI
+    for every lookup. Returns None where the frameworks are unavailable
+    (e.g. non-macOS), in which case callers fall back to the CLI.
+    """
+    try:
+        sec = ctypes.CDLL(_SECURITY_FRAMEWORK)
+        cf = ctypes.CDLL(_CORE_FOUNDATION)
+    except OSError:
+        return None
+
+    u32, vp, cp = ctypes.c_uint32, ctypes.c_void_p, ctypes.c_char_p
+    sec.SecKeychainFindGenericPassword.argtypes = [
+        vp, u32, cp, u32, cp, ctypes.POINTER(u32), ctypes.POINTER(vp), ctypes.POINTER(vp),
+    ]
+    sec.SecKeychainFindGenericPassword.restype = ctypes.c_int32
+    sec.SecKeychainAddGenericPassword.argtypes = [vp, u32, cp, u32, cp, u32, cp, ctypes.POINTER(vp)]
+    sec.SecKeychainAddGenericPassword.restype = ctypes.c_int32
+    sec.SecKeychainItemModifyAttributesAndData.argtypes = [vp, vp, u32, cp]
+    sec.SecKeychainItemModifyAttributesAndData.restype = ctypes.c_int32
+    sec.SecKeychainItemFreeContent.argtypes = [vp, vp]
+    sec.SecKeychainItemFreeContent.restype = ctypes.c_int32
+    cf.CFRelease.argtypes = [vp]
+    cf.CFRelease.restype = None
+    return sec, cf
+
+
+def _framework_find_password(sec: ctypes.CDLL, account: str) -> str | None:
+    """Look up the password with SecKeychainFindGenericPassword.
+
+    Returns None only when the item does not exist.
+
+    Raises:
+        OSError: For any other OSStatus (e.g. the item's ACL needs a prompt,
+            or ``errSecInteractionNotAllowed`` under cron/launchd), so the
+            caller can fall back to the ``security`` CLI.
+    """
+    service = KEYCHAIN_SERVICE.encode()
+    acct = account.encode()
+    length = ctypes.c_uint32()
+    data = ctypes.c_void_p()
+    status = sec.SecKeychainFindGenericPassword(
+        None, len(service), service, len(acct), acct,
+        ctypes.byref(length), ctypes.byref(data), None,
+    )
+    if status == _ERR_SEC_ITEM_NOT_FOUND:
+        return None
+    if status != 0:
+        raise OSError(f"SecKeychainFindGenericPassword failed: OSStatus {status}")
+    try:
+        return ctypes.string_at(data, length.value).decode("utf-8")
+    finally:
+        sec.SecKeychainItemFreeContent(None, data)
+
+
+def _framework_set_password(sec: ctypes.CDLL, cf: ctypes.CDLL, account: str, password: str) -> None:
+    """Update the existing Keychain item in place, or add a new one.
+
+    Raises:
+        OSError: If any Keychain call fails, so the caller can fall back to
+            the ``security`` CLI.
+    """
+    service = KEYCHAIN_SERVICE.encode()
+    acct = account.encode()
+    secret = password.encode()
+    item = ctypes.c_void_p()
+    status = sec.SecKeychainFindGenericPassword(
+        None, len(service), service, len(acct), acct, None, None, ctypes.byref(item),
+    )
+    if status == 0:
+        try:
+            status = sec.SecKeychainItemModifyAttributesAndData(item, None, len(secret), secret)
+        finally:
+            cf.CFRelease(item)
+    elif status == _ERR_SEC_ITEM_NOT_FOUND:
+        status = sec.SecKeychainAddGenericPassword(
+            None, len(service), service, len(acct), acct, len(secret), secret, None,
+        )
+    if status != 0:
+        raise OSError(f"Failed to store password in Keychain: OSStatus {status}")
+
 
 def get_keychain_password(account: str) -> str | None:
     """Read the Gmail app password from macOS Keychain.
 
+    Uses Security.framework directly when it can be loaded. Any framework
+    error other than "item not found" falls back to the ``security`` CLI,
+    whose access to the item doesn't need an interactive prompt.
+
     Args:
         account: The account name (email address) stored in Keychain.
 
     Returns:
         The password string, or None if not found.
     """
+    lib = _security_lib()
+    if lib is not None:
+        try:
+            return _framework_find_password(lib[0], account)
+        except (OSError, AttributeError, UnicodeDecodeError) as e:
+            logger.debug("Security.framework lookup failed, using security CLI: %s", e)
+
     result = subprocess.run(
         ["security", "find-generic-password", "-s", KEYCHAIN_SERVICE, "-a", account, "-w"],
         capture_output=True,
@@ -40,7 +158,9 @@ def get_keychain_password(account: str) -> str | None:
 def set_keychain_password(account: str, password: str) -> None:
     """Store the Gmail app password in macOS Keychain.
 
-    Deletes any existing entry first, then adds the new one.
+    Uses Security.framework directly when it can be loaded. Otherwise falls
+    back to a single ``security add-generic-password -U`` call, which
+    updates an existing entry in place.
 
     Args:
         account: The account name (email address) to store against.
@@ -49,13 +169,21 @@ def set_keychain_password(account: str, password: str) -> None:
     Raises:
         RuntimeError: If the Keychain operation fails.
     """
-    # Delete existing entry (ignore errors if not found)
-    subprocess.run(
-        ["security", "delete-generic-password", "-s", KEYCHAIN_SERVICE, "-a", account],
-        capture_output=True,
-    )
+    lib = _security_lib()
+    if lib is not None:
+        try:
+            _framework_set_password(lib[0], lib[1], account, password)
+            return
+        except (OSError, AttributeError) as e:
+            logger.debug("Security.framework store failed, using security CLI: %s", e)
+
+    # -U updates an existing entry, so there is no delete step that could
+    # succeed and leave no credential if the add then fails
     result = subprocess.run(
-        ["security", "add-generic-password", "-s", KEYCHAIN_SERVICE, "-a", account, "-w", password],
+        [
+            "security", "add-generic-password", "-U",
+            "-s", KEYCHAIN_SERVICE, "-a", account, "-w", password,
+        ],
         capture_output=True,
         text=True,
     )
@@ -65,52 +193,31 @@ def set_keychain_password(account: str, password: str) -> None:
 
 def _build_subject() -> str:
     """Build the email subject line in French."""
-    from morning_report.report.generator import FRENCH_DAYS, FRENCH_MONTHS
+    from morning_report.report.generator import french_date
 
-    now = datetime.now()
-    day_name = FRENCH_DAYS.get(now.strftime("%A"), now.strftime("%A"))
-    day_num = now.day
-    month_name = FRENCH_MONTHS.get(now.month, str(now.month))
-    return f"Francais du jour — {day_name} {day_num} {month_name} {now.year}"
+    return f"Francais du jour — {french_date(datetime.now())}"
 
 
 def _build_summary(data: dict) -> str:
     """Build a plain-text French summary from gathered JSON data."""
-    from morning_report.report.generator import FRENCH_DAYS, FRENCH_MONTHS
-
-    now = datetime.now()
-    day_name = FRENCH_DAYS.get(now.strftime("%A"), now.strftime("%A"))
-    day_num = now.day
-    month_name = FRENCH_MONTHS.get(now.month, str(now.month))
+    from morning_report.report.generator import french_date
 
     lines = []
-    lines.append(f"Francais du jour — {day_name} {day_num} {month_name} {now.year}")
+    lines.append(f"Francais du jour — {french_date(datetime.now())}")
     lines.append("")
 
     # Meteo
     weather = data.get("weather", {})
-    if weather.get("status") == "ok":
-        for loc_name, loc_data in weather.get("locations", {}).items():
-            current = loc_data.get("current", {})
-            if current:
-                desc = current.get("description", "")
-                temp = current.get("temp", "")
-                lines.append(f"Meteo : {loc_name} — {desc}, {temp}°C")
-                break
+    first = _first_current(weather) if weather.get("status") == "ok" else None
+    if first is not None:
+        loc_name, current = first
+        description, temp = current.get("description", ""), current.get("temp", "")
+        lines.append(f"Meteo : {loc_name} — {description}, {temp}°C")
 
     # Marches
     markets = data.get("markets", {})
     if markets.get("status") == "ok":
-        crypto = markets.get("crypto", {})
-        parts = []
-        for coin_id, coin_data in crypto.items():
-            price = coin_data.get("price_usd")
-            symbol = coin_data.get("symbol", coin_id).upper()
-            if price is not None:
-                if price >= 100:
-                    parts.append(f"{symbol} ${price:,.0f}")
-                else:
-                    parts.append(f"{symbol} ${price:.4f}")
+        parts = _crypto_parts(markets.get("crypto", {}))
         if parts:
             lines.append(f"Marches : {', '.join(parts)}")
 
@@ -119,51 +226,273 @@ def _build_summary(data: dict) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=8)
+def _encoded_attachment(path: str, mtime_ns: int, size: int) -> str:
+    """Read and base64-encode an attachment, memoised on its stat signature.
+
+    ``mtime_ns`` and ``size`` are part of the cache key so a rewritten file is
+    re-read; retries that rebuild the message for the same report skip the
+    encode entirely.
+
+    The file is memory-mapped and encoded one MIME line at a time, so the raw
+    bytes are never copied into memory alongside the encoded text.
+    """
+    if size == 0:
+        return ""  # empty files can't be mapped
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            encoded = bytearray()
+            for i in range(0, len(view), _B64_LINE_BYTES):
+                encoded += binascii.b2a_base64(view[i:i + _B64_LINE_BYTES])
+    return encoded.decode("ascii")
+
+
+# Subtrees of the gathered data that _build_summary reads
+_SUMMARY_PATHS = frozenset({
+    "weather.status",
+    "weather.locations",
+    "markets.status",
+    "markets.crypto",
+})
+
+# ijson is slower than a full parse at every size; stream only when the file
+# is big enough that materialising all of it would cost real memory
+_STREAM_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _summary_data_from_stream(fp: BinaryIO) -> dict:
+    """Stream a gathered-data JSON file, materialising only what the summary needs.
+
+    Large sections (meditation text, French content) go past as parser events
+    and are never built into objects, so memory stays flat as the report grows.
+    Returns a sparse dict shaped like the full data, for :func:`_build_summary`.
+
+    Raises:
+        json.JSONDecodeError: If the stream is not valid JSON, as for
+            :func:`jsonio.load_file`.
+    """
+    data: dict = {}
+    builder = None
+    path = ""
+    depth = 0
+    try:
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if builder is None:
+                if prefix not in _SUMMARY_PATHS or event in ("map_key", "end_map", "end_array"):
+                    continue
+                builder, path, depth = ijson.ObjectBuilder(), prefix, 0
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                section, key = path.split(".")
+                data.setdefault(section, {})[key] = builder.value
+                builder = None
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+    return data
+
+
+def _load_summary_data(json_path: Path, size: int) -> dict:
+    """Load the parts of the gathered data used for the email summary.
+
+    Files of ``_STREAM_MIN_BYTES`` or more are streamed with ijson when it is
+    installed; smaller ones are parsed whole, which is faster.
+    """
+    if ijson is None or size < _STREAM_MIN_BYTES:
+        return jsonio.load_file(json_path)
+    with open(json_path, "rb") as fp:
+        return _summary_data_from_stream(fp)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_summary(path: str, mtime_ns: int, size: int, today: date) -> str:
+    """Build the summary body for a gathered-data file, memoised on its stat signature.
+
+    ``today`` is part of the key because the summary's heading carries the date.
+    """
+    return _build_summary(_load_summary_data(Path(path), size))
+
+
 def build_message(
     docx_path: Path,
-    json_path: Path,
+    json_path: Path | None,
     recipient: str,
     sender: str,
+    data: dict | None = None,
 ) -> EmailMessage:
     """Build the email message with summary body and .docx attachment.
 
     Args:
         docx_path: Path to the .docx report file.
         json_path: Path to the gathered data JSON (for summary extraction).
+            Not read when ``data`` is given, and may then be None.
         recipient: Email address to send to.
         sender: Email address to send from.
+        data: The gathered data, if the caller already has it in memory.
 
     Returns:
         A fully constructed EmailMessage.
+
+    Raises:
+        ValueError: If neither json_path nor data is given.
+        FileNotFoundError: If docx_path or json_path don't exist.
     """
-    # Load gathered data for summary
-    with open(json_path) as f:
-        data = json.load(f)
+    return _compose_message(docx_path, _summary_text(json_path, data), recipient, sender)
+
+
+def _summary_text(json_path: Path | None, data: dict | None) -> str:
+    """Summary body from in-memory ``data``, else from the file at ``json_path``."""
+    if data is not None:
+        return _build_summary(data)
+    if json_path is None:
+        raise ValueError("either json_path or data is required")
+    json_path = Path(json_path)
+    try:
+        st = json_path.stat()
+        return _cached_summary(str(json_path), st.st_mtime_ns, st.st_size, date.today())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"JSON data not found: {json_path}") from None
+
+
+def _compose_message(docx_path: Path, summary: str, recipient: str, sender: str) -> EmailMessage:
+    """Assemble the message around an already-built summary body."""
+    docx_path = Path(docx_path)
+    try:
+        st = docx_path.stat()
+        encoded = _encoded_attachment(str(docx_path), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Word document not found: {docx_path}") from None
 
     msg = EmailMessage()
     msg["Subject"] = _build_subject()
-    msg.set_content(_build_summary(data))
+    msg.set_content(summary)
     msg["From"] = sender
     msg["To"] = recipient
 
-    # Attach .docx
-    docx_bytes = docx_path.read_bytes()
-    msg.add_attachment(
-        docx_bytes,
-        maintype="application",
-        subtype="vnd.openxmlformats-officedocument.wordprocessingml.document",
-        filename=docx_path.name,
-    )
+    # Attach .docx from the pre-encoded payload
+    part = MIMEPart()
+    part["Content-Type"] = DOCX_MIME
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=docx_path.name)
+    part.set_payload(encoded)
+    msg.make_mixed()
+    msg.attach(part)
 
     return msg
 
 
+class SMTPSession:
+    """An authenticated Gmail SMTP connection that reconnects when it goes stale.
+
+    The connection is opened lazily on the first :meth:`send`. Before reusing
+    it, a ``NOOP`` checks that the server is still there; if not, the session
+    reconnects, re-authenticates with the stored credentials and carries on.
+    A connection idle for longer than ``max_idle`` seconds is replaced without
+    probing, since Gmail drops idle sessions on its own.
+
+    Pass one session to several :func:`send_report` calls to pay the
+    TLS + AUTH handshake once::
+
+        with SMTPSession(sender, app_password) as session:
+            for recipient in recipients:
+                send_report(docx_path, json_path, recipient, sender, smtp=session)
+    """
+
+    def __init__(
+        self,
+        sender: str,
+        app_password: str,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        timeout: float = 60,
+        max_idle: float = 100,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._sender = sender
+        self._password = app_password
+        self._stack: ExitStack | None = None
+        self._server: smtplib.SMTP | None = None
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        stack = ExitStack()
+        server = stack.enter_context(smtplib.SMTP(self.host, self.port, timeout=self.timeout))
+        try:
+            server.starttls()
+            server.login(self._sender, self._password)
+        except BaseException:
+            stack.close()
+            raise
+        self._stack, self._server = stack, server
+        return server
+
+    def _alive(self) -> bool:
+        try:
+            self._server.noop()
+        except (smtplib.SMTPServerDisconnected, OSError):
+            return False
+        return True
+
+    def send(self, msg: EmailMessage) -> None:
+        """Send a message, (re)connecting first if needed."""
+        if self._server is not None:
+            if time.monotonic() - self._last_used > self.max_idle:
+                self.close()
+            elif not self._alive():
+                logger.info("SMTP connection went stale, reconnecting")
+                self.close()
+        server = self._server or self._connect()
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped between the NOOP and DATA: reconnect and retry once
+            self.close()
+            self._connect().send_message(msg)
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        """Close the connection (QUIT if the server is still listening)."""
+        stack, self._stack, self._server = self._stack, None, None
+        if stack is not None:
+            try:
+                stack.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _resolve_password(sender: str, app_password: str | None) -> str:
+    """Resolve the app password: explicit arg (unless a placeholder) → Keychain."""
+    if not app_password or app_password.startswith("${"):
+        app_password = get_keychain_password(sender)
+    if not app_password:
+        raise ValueError(
+            "Gmail app password not found. Store it with:\n"
+            "  morning-report set-password\n"
+            "Generate one at https://myaccount.google.com/apppasswords"
+        )
+    return app_password
+
+
 def send_report(
     docx_path: Path,
     json_path: Path,
     recipient: str,
     sender: str,
     app_password: str | None = None,
+    smtp: SMTPSession | None = None,
+    data: dict | None = None,
 ) -> None:
     """Send morning report via Gmail SMTP with .docx attachment and summary body.
 
@@ -171,40 +500,65 @@ def send_report(
     1. Explicit app_password argument (if provided and not a placeholder)
     2. macOS Keychain (service: morning-report-gmail, account: sender)
 
+    When ``smtp`` is given the message goes through that (already
+    authenticated) session, which is left open for the caller to reuse, and
+    no password is needed.
+
     Args:
         docx_path: Path to the .docx report file.
         json_path: Path to the gathered data JSON (for summary extraction).
         recipient: Email address to send to.
         sender: Email address to send from.
         app_password: Gmail app password. If None, reads from macOS Keychain.
+        smtp: Optional shared session to send through.
+        data: The gathered data, if already in memory (json_path is then not read).
 
     Raises:
         ValueError: If no password can be resolved.
         FileNotFoundError: If docx_path or json_path don't exist.
     """
-    # Resolve password: explicit arg → Keychain
-    if not app_password or app_password.startswith("${"):
-        app_password = get_keychain_password(sender)
-    if not app_password:
-        raise ValueError(
-            "Gmail app password not found. Store it with:\n"
-            "  morning-report set-password\n"
-            "Generate one at https://myaccount.google.com/apppasswords"
-        )
+    if smtp is not None:
+        smtp.send(build_message(docx_path, json_path, recipient, sender, data=data))
+        logger.info("Report emailed to %s", recipient)
+        return
 
-    docx_path = Path(docx_path)
-    json_path = Path(json_path)
+    send_report_many(docx_path, json_path, [recipient], sender, app_password, data=data)
 
-    if not docx_path.exists():
-        raise FileNotFoundError(f"Word document not found: {docx_path}")
-    if not json_path.exists():
-        raise FileNotFoundError(f"JSON data not found: {json_path}")
 
-    msg = build_message(docx_path, json_path, recipient, sender)
+def send_report_many(
+    docx_path: Path,
+    json_path: Path,
+    recipients: list[str],
+    sender: str,
+    app_password: str | None = None,
+    data: dict | None = None,
+) -> None:
+    """Send the morning report to several recipients over one SMTP connection.
+
+    Each recipient gets their own message (so addresses aren't disclosed to
+    each other), but the TLS handshake and login happen once, the summary
+    is built once, and the encoded attachment is cached across messages.
 
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=60) as server:
-        server.starttls()
-        server.login(sender, app_password)
-        server.send_message(msg)
+    Args:
+        docx_path: Path to the .docx report file.
+        json_path: Path to the gathered data JSON (for summary extraction).
+        recipients: Email addresses to send to.
+        sender: Email address to send from.
+        app_password: Gmail app password. If None, reads from macOS Keychain.
+        data: The gathered data, if already in memory (json_path is then not read).
 
-    logger.info("Report emailed to %s", recipient)
+    Raises:
+        ValueError: If no password can be resolved.
+        FileNotFoundError: If docx_path or json_path don't exist.
+    """
+    app_password = _resolve_password(sender, app_password)
+    summary = _summary_text(json_path, data)
+    messages = [
+        _compose_message(docx_path, summary, recipient, sender)
+        for recipient in recipients
+    ]
+
+    with SMTPSession(sender, app_password) as session:
+        for recipient, msg in zip(recipients, messages, strict=True):
+            session.send(msg)
+            logger.info("Report emailed to %s", recipient)
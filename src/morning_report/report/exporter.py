@@ -2,43 +2,441 @@
 
 from __future__ import annotations
 
+import atexit
+import base64
+import functools
 import logging
+import re
+import socket
 import subprocess
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+import requests
 
 logger = logging.getLogger(__name__)
 
+ENGINES = ("pandoc", "pandoc-server", "python-docx")
+
+_PANDOC_SERVER_STARTUP = 5.0  # seconds to wait for `pandoc server` to accept connections
+_PANDOC_SERVER_TIMEOUT = 60
+
+# Inline markup emitted by the report template: **bold**, *italic*, [text](url)
+_INLINE_RE = re.compile(r"(\*\*.+?\*\*|\*[^*\s][^*]*\*|\[[^\]]+\]\([^)]+\))")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_NUMBERED_RE = re.compile(r"^\d+\.\s+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_TABLE_SEPARATOR_RE = re.compile(r"^\|[\s:|-]+\|$")
+
+
+def _pandoc_args(md_path: Path | None, output_path: Path) -> list[str]:
+    """Build the pandoc command line for a markdown → docx conversion.
+
+    With ``md_path=None`` pandoc reads the markdown from stdin.
+    """
+    if md_path is None:
+        return ["pandoc", "-o", str(output_path), "--from=markdown", "--to=docx"]
+    return ["pandoc", str(md_path), "-o", str(output_path), "--from=markdown", "--to=docx"]
+
+
+@functools.cache
+def _pandoc_server_url() -> str | None:
+    """Start one long-lived ``pandoc server`` (pandoc 3+) for this process.
+
+    Saves pandoc's runtime start-up on every export after the first. The
+    server runs in pandoc's sandbox (no file or network access) and is
+    terminated at interpreter exit.
+
+    Returns:
+        The server's base URL, or None if it can't be started (pandoc missing
+        or older than 3.0), in which case exports run pandoc per call.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    try:
+        proc = subprocess.Popen(
+            ["pandoc", "server", "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        logger.info("pandoc server unavailable (%s), running pandoc per export", e)
+        return None
+    atexit.register(proc.terminate)
+
+    deadline = time.monotonic() + _PANDOC_SERVER_STARTUP
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            logger.info("pandoc server exited (needs pandoc 3+), running pandoc per export")
+            return None
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                return f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+
+    proc.terminate()
+    logger.info("pandoc server did not start in time, running pandoc per export")
+    return None
+
+
+def _convert_via_server(url: str, md_text: str) -> bytes:
+    """Convert markdown to docx bytes with a running ``pandoc server``.
+
+    Raises:
+        RuntimeError: If the server reports a conversion failure.
+        requests.ConnectionError: If the server can't be reached.
+    """
+    response = requests.post(
+        url,
+        json={"text": md_text, "from": "markdown", "to": "docx"},
+        headers={"Accept": "application/json"},
+        timeout=_PANDOC_SERVER_TIMEOUT,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"pandoc server failed ({response.status_code}): {response.text.strip()}"
+        )
+    body = response.json()
+    output = body["output"]
+    return base64.b64decode(output) if body.get("base64") else output.encode("utf-8")
+
+
+def _add_inline(paragraph, text: str, bold: bool = False, italic: bool = False) -> None:
+    """Append text to a python-docx paragraph, honouring inline markup."""
+    for token in _INLINE_RE.split(text):
+        if not token:
+            continue
+        if token.startswith("**") and token.endswith("**") and len(token) > 4:
+            _add_inline(paragraph, token[2:-2], bold=True, italic=italic)
+        elif token.startswith("*") and token.endswith("*") and len(token) > 2:
+            _add_inline(paragraph, token[1:-1], bold=bold, italic=True)
+        elif (link := _LINK_RE.fullmatch(token)) is not None:
+            run = paragraph.add_run(link.group(1))
+            run.bold, run.italic, run.underline = bold, italic, True
+        else:
+            run = paragraph.add_run(token)
+            run.bold, run.italic = bold, italic
+
+
+def _add_horizontal_rule(document) -> None:
+    """Add an empty paragraph with a bottom border, as pandoc does for ``---``."""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    paragraph = document.add_paragraph()
+    borders = OxmlElement("w:pBdr")
+    bottom = OxmlElement("w:bottom")
+    for key, value in (("w:val", "single"), ("w:sz", "6"), ("w:space", "1"), ("w:color", "auto")):
+        bottom.set(qn(key), value)
+    borders.append(bottom)
+    paragraph._p.get_or_add_pPr().append(borders)
+
+
+def _add_table(document, rows: list[str]) -> None:
+    """Add a pipe table; the first row is the header, separator rows are skipped."""
+    cells = [
+        [c.strip() for c in row.strip().strip("|").split("|")]
+        for row in rows
+        if not _TABLE_SEPARATOR_RE.match(row.strip())
+    ]
+    if not cells:
+        return
+    width = max(len(r) for r in cells)
+    table = document.add_table(rows=len(cells), cols=width)
+    table.style = "Table Grid"
+    for r, row in enumerate(cells):
+        for c, value in enumerate(row):
+            cell_paragraph = table.cell(r, c).paragraphs[0]
+            _add_inline(cell_paragraph, value, bold=(r == 0))
+
+
+def _md_to_docx(md_text: str, output_path: Path) -> None:
+    """Write the report markdown straight to .docx with python-docx.
+
+    This is not a general markdown converter: it handles the constructs the
+    report template produces (ATX headings, paragraphs, pipe tables, ``-`` and
+    numbered lists, ``>`` quotes, ``---`` rules and bold/italic/link inlines).
+    Raw HTML tags (the answers ``<details>`` block) are dropped, keeping their text.
+    Numbered items keep their literal numbers, since Word would otherwise
+    continue numbering across the questions and answers lists.
+    """
+    import docx
+
+    document = docx.Document()
+    paragraph_lines: list[str] = []
+    table_rows: list[str] = []
+
+    def flush_paragraph():
+        if paragraph_lines:
+            _add_inline(document.add_paragraph(), " ".join(paragraph_lines))
+            paragraph_lines.clear()
+
+    def flush_table():
+        if table_rows:
+            _add_table(document, table_rows)
+            table_rows.clear()
+
+    for raw_line in md_text.splitlines():
+        line = raw_line.strip()
+        if line.startswith("<"):
+            line = _HTML_TAG_RE.sub("", line).strip()
 
-def export_docx(md_path: Path, output_path: Path | None = None) -> Path:
-    """Convert a markdown report to a Word document via pandoc.
+        if line.startswith("|"):
+            flush_paragraph()
+            table_rows.append(line)
+            continue
+        flush_table()
+
+        if not line:
+            flush_paragraph()
+        elif line == "---":
+            flush_paragraph()
+            _add_horizontal_rule(document)
+        elif (heading := _HEADING_RE.match(line)) is not None:
+            flush_paragraph()
+            _add_inline(document.add_heading(level=len(heading.group(1))), heading.group(2))
+        elif line.startswith("- "):
+            flush_paragraph()
+            _add_inline(document.add_paragraph(style="List Bullet"), line[2:])
+        elif _NUMBERED_RE.match(line):
+            flush_paragraph()
+            _add_inline(document.add_paragraph(style="List Paragraph"), line)
+        elif line.startswith(">"):
+            flush_paragraph()
+            _add_inline(document.add_paragraph(style="Quote"), line.lstrip("> "))
+        else:
+            paragraph_lines.append(line)
+
+    flush_paragraph()
+    flush_table()
+    document.save(str(output_path))
+
+
+def export_docx(
+    md_path: Path | bytes,
+    output_path: Path | None = None,
+    engine: str = "pandoc",
+) -> Path:
+    """Convert a markdown report to a Word document.
 
     Args:
-        md_path: Path to the markdown file.
-        output_path: Where to write the .docx. Defaults to md_path with .docx suffix.
+        md_path: Path to the markdown file, or the UTF-8 markdown itself as
+            bytes (piped to pandoc on stdin, so no intermediate file is needed).
+        output_path: Where to write the .docx. Defaults to md_path with .docx
+            suffix; required when passing markdown bytes.
+        engine: ``"pandoc"`` (default) shells out to pandoc; ``"pandoc-server"``
+            reuses one ``pandoc server`` process for every export (pandoc 3+,
+            falling back to ``"pandoc"`` otherwise); ``"python-docx"`` writes
+            the document in-process, with no pandoc dependency.
 
     Returns:
         Path to the generated .docx file.
 
     Raises:
         FileNotFoundError: If the markdown file does not exist.
-        RuntimeError: If pandoc fails.
+        ValueError: If the engine is unknown, or bytes are given without an
+            output_path.
+        RuntimeError: If pandoc fails, or python-docx is not installed.
     """
-    md_path = Path(md_path)
-    if not md_path.exists():
-        raise FileNotFoundError(f"Markdown file not found: {md_path}")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown export engine {engine!r}, expected one of {ENGINES}")
 
-    if output_path is None:
-        output_path = md_path.with_suffix(".docx")
+    md_bytes: bytes | None = None
+    if isinstance(md_path, (bytes, bytearray, memoryview)):
+        if output_path is None:
+            raise ValueError("output_path is required when exporting markdown bytes")
+        md_bytes, source = bytes(md_path), "<markdown>"
+    else:
+        md_path = Path(md_path)
+        if not md_path.exists():
+            raise FileNotFoundError(f"Markdown file not found: {md_path}")
+        source = md_path.name
+        if output_path is None:
+            output_path = md_path.with_suffix(".docx")
     output_path = Path(output_path)
 
-    result = subprocess.run(
-        ["pandoc", str(md_path), "-o", str(output_path), "--from=markdown", "--to=docx"],
-        capture_output=True,
-        text=True,
-    )
+    if engine == "python-docx":
+        try:
+            import docx  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "python-docx not installed. Run: uv pip install 'morning-report[docx]'"
+            ) from None
+        md_text = (
+            md_bytes.decode("utf-8") if md_bytes is not None
+            else md_path.read_text(encoding="utf-8")
+        )
+        _md_to_docx(md_text, output_path)
+        logger.info("Exported %s → %s (python-docx)", source, output_path.name)
+        return output_path
+
+    if engine == "pandoc-server":
+        url = _pandoc_server_url()
+        if url is not None:
+            md_text = (
+                md_bytes.decode("utf-8") if md_bytes is not None
+                else md_path.read_text(encoding="utf-8")
+            )
+            try:
+                output_path.write_bytes(_convert_via_server(url, md_text))
+            except requests.ConnectionError as e:
+                logger.warning("pandoc server unreachable (%s), running pandoc directly", e)
+            else:
+                logger.info("Exported %s → %s (pandoc server)", source, output_path.name)
+                return output_path
+
+    if md_bytes is not None:
+        result = subprocess.run(
+            _pandoc_args(None, output_path),
+            input=md_bytes,
+            capture_output=True,
+        )
+        stderr = result.stderr.decode("utf-8", errors="replace")
+    else:
+        result = subprocess.run(
+            _pandoc_args(md_path, output_path),
+            capture_output=True,
+            text=True,
+        )
+        stderr = result.stderr
 
     if result.returncode != 0:
-        raise RuntimeError(f"pandoc failed (exit {result.returncode}): {result.stderr.strip()}")
+        raise RuntimeError(f"pandoc failed (exit {result.returncode}): {stderr.strip()}")
 
-    logger.info("Exported %s → %s", md_path.name, output_path.name)
+    logger.info("Exported %s → %s", source, output_path.name)
     return output_path
+
+
+def export_docx_many(
+    md_paths: list[Path],
+    output_paths: list[Path] | None = None,
+) -> list[Path]:
+    """Convert several markdown reports to Word documents concurrently.
+
+    All pandoc processes are started before any is waited on, so their
+    start-up costs overlap instead of adding up.
+
+    Args:
+        md_paths: Paths to the markdown files.
+        output_paths: Where to write each .docx, in the same order as md_paths.
+            Defaults to each md_path with a .docx suffix.
+
+    Returns:
+        Paths to the generated .docx files, in input order.
+
+    Raises:
+        FileNotFoundError: If any markdown file does not exist.
+        ValueError: If output_paths does not match md_paths in length.
+        RuntimeError: If pandoc fails for any file.
+    """
+    md_paths = [Path(p) for p in md_paths]
+    for md_path in md_paths:
+        if not md_path.exists():
+            raise FileNotFoundError(f"Markdown file not found: {md_path}")
+
+    if output_paths is None:
+        output_paths = [p.with_suffix(".docx") for p in md_paths]
+    output_paths = [Path(p) for p in output_paths]
+    if len(output_paths) != len(md_paths):
+        raise ValueError(
+            f"Got {len(md_paths)} markdown files but {len(output_paths)} output paths"
+        )
+
+    start = time.perf_counter()
+    procs: list[subprocess.Popen] = []
+    try:
+        for md_path, output_path in zip(md_paths, output_paths, strict=True):
+            procs.append(subprocess.Popen(
+                _pandoc_args(md_path, output_path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            ))
+    except OSError:
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+        raise
+
+    failures = []
+    for md_path, output_path, proc in zip(md_paths, output_paths, procs, strict=True):
+        _, stderr = proc.communicate()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            failures.append(f"{md_path.name} (exit {proc.returncode}): {(stderr or '').strip()}")
+            continue
+        logger.info("Exported %s → %s (%.0f ms)", md_path.name, output_path.name, elapsed_ms)
+
+    if failures:
+        raise RuntimeError(f"pandoc failed: {'; '.join(failures)}")
+
+    logger.debug(
+        "Exported %d documents in %.0f ms", len(md_paths), (time.perf_counter() - start) * 1000,
+    )
+    return output_paths
+
+
+def generate_and_export_all(
+    reports: Iterable[tuple[dict[str, Any], datetime | None, dict[str, Any] | None]],
+    output_dir: Path,
+    engine: str = "pandoc",
+    max_workers: int = 4,
+) -> list[Path]:
+    """Render several reports to markdown and export each to .docx, overlapping the work.
+
+    Each report's export is submitted as soon as its markdown is written, so
+    pandoc runs for one report while others are still rendering. Wall time is
+    roughly the slowest render plus the slowest export rather than their sum.
+
+    Args:
+        reports: ``(data, date, french_content)`` tuples, as passed to
+            :func:`~morning_report.report.generator.generate_report`. A None
+            date means today, read once for the whole batch.
+        output_dir: Directory for the .md and .docx files.
+        engine: Export engine passed to :func:`export_docx`.
+        max_workers: Thread pool size.
+
+    Returns:
+        Paths to the generated .docx files, in input order.
+
+    Raises:
+        ValueError: If two reports fall on the same day, since their files
+            would overwrite each other. Nothing is written in that case.
+        RuntimeError: If any export fails (first failure wins).
+    """
+    from morning_report.report.generator import _report_path, write_report
+
+    output_dir = Path(output_dir)
+    now = datetime.now()
+    reports = [(data, date or now, french_content) for data, date, french_content in reports]
+    counts = Counter(_report_path(output_dir, date) for _, date, _ in reports)
+    clashes = sorted(path.name for path, n in counts.items() if n > 1)
+    if clashes:
+        raise ValueError(f"Several reports would write the same file: {', '.join(clashes)}")
+    docx_paths: list[Path | None] = [None] * len(reports)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        renders = {
+            pool.submit(
+                write_report, data, output_dir=output_dir, date=date,
+                french_content=french_content,
+            ): i
+            for i, (data, date, french_content) in enumerate(reports)
+        }
+        exports = {}
+        for future in as_completed(renders):
+            md_path = future.result()
+            exports[pool.submit(export_docx, md_path, engine=engine)] = renders[future]
+        for future in as_completed(exports):
+            docx_paths[exports[future]] = future.result()
+
+    return docx_paths
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import os
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from morning_report import jsonio
+from morning_report.french_gen import _FALLBACK_MSG
 
 logger = logging.getLogger(__name__)
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
+_TEMPLATE_NAME = "french_learning.md.j2"
 
-# French day and month names for date formatting
-FRENCH_DAYS = {
+# French day and month names for date formatting (read-only lookup tables)
+FRENCH_DAYS = MappingProxyType({
     "Monday": "lundi",
     "Tuesday": "mardi",
     "Wednesday": "mercredi",
@@ -23,9 +30,9 @@ FRENCH_DAYS = {
     "Friday": "vendredi",
     "Saturday": "samedi",
     "Sunday": "dimanche",
-}
+})
 
-FRENCH_MONTHS = {
+FRENCH_MONTHS = MappingProxyType({
     1: "janvier",
     2: "fevrier",
     3: "mars",
@@ -38,9 +45,13 @@ FRENCH_MONTHS = {
     10: "octobre",
     11: "novembre",
     12: "decembre",
-}
+})
+
+# Positional views of the tables above, indexed by date.weekday() and date.month
+_FRENCH_DAY_NAMES = tuple(FRENCH_DAYS.values())
+_FRENCH_MONTH_NAMES = ("",) + tuple(FRENCH_MONTHS.values())
 
-WEATHER_FR = {
+WEATHER_FR = MappingProxyType({
     "clear sky": "ciel degage",
     "few clouds": "quelques nuages",
     "scattered clouds": "nuages epars",
@@ -59,21 +70,157 @@ WEATHER_FR = {
     "haze": "brume seche",
     "drizzle": "bruine",
     "light intensity drizzle": "bruine legere",
-}
+})
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write a whole file through a raw fd, bypassing Python's buffered I/O layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def french_date(date: datetime) -> str:
     """Format a date in French: 'jeudi 26 fevrier 2026'."""
-    day_name = FRENCH_DAYS[date.strftime("%A")]
-    day_num = date.day
-    month_name = FRENCH_MONTHS[date.month]
-    year = date.year
-    return f"{day_name} {day_num} {month_name} {year}"
+    # Cache on the calendar day: datetime.now() values never repeat
+    return _french_day(date.year, date.month, date.day)
+
 
+@functools.lru_cache(maxsize=32)
+def _french_day(year: int, month: int, day: int) -> str:
+    day_name = _FRENCH_DAY_NAMES[datetime(year, month, day).weekday()]
+    return f"{day_name} {day} {_FRENCH_MONTH_NAMES[month]} {year}"
 
+
+@functools.lru_cache(maxsize=64)
 def _weather_fr(description: str) -> str:
-    """Translate a weather description to French, falling back to original."""
-    return WEATHER_FR.get(description.lower(), description)
+    """Translate a weather description to French, falling back to original.
+
+    Memoised: a report repeats the same handful of descriptions across its
+    locations and forecast rows.
+    """
+    # OpenWeatherMap descriptions are already lowercase; only fold on a miss
+    hit = WEATHER_FR.get(description)
+    return hit if hit is not None else WEATHER_FR.get(description.lower(), description)
+
+
+_TEMPLATE_CACHE_ENV = "MORNING_REPORT_TEMPLATE_CACHE"
+_TEMPLATE_CACHE_DIR = Path.home() / ".cache" / "morning-report" / "templates"
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """On-disk cache of compiled templates, so a fresh process skips the Jinja parse.
+
+    Lives in ``~/.cache/morning-report/templates`` next to the other caches,
+    or in ``$MORNING_REPORT_TEMPLATE_CACHE`` when that is set. Returns None
+    (compile in memory only) if the directory can't be created.
+    """
+    directory = os.environ.get(_TEMPLATE_CACHE_ENV) or _TEMPLATE_CACHE_DIR
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        return FileSystemBytecodeCache(str(directory), pattern="morning_report-%s.cache")
+    except (OSError, RuntimeError) as e:
+        logger.debug("Jinja bytecode cache unavailable: %s", e)
+        return None
+
+
+@functools.cache
+def _environment() -> Environment:
+    """Build the Jinja environment for report templates, once per process.
+
+    Jinja's own template cache is disabled; :func:`_template` keeps compiled
+    templates and decides when to recompile.
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=0,
+        bytecode_cache=_bytecode_cache(),
+    )
+    env.filters["weather_fr"] = _weather_fr
+    return env
+
+
+# Compiled templates keyed by name, with the source mtime they were built from
+_TEMPLATE_CACHE: dict[str, tuple[Template, int]] = {}
+
+
+def _template(name: str = _TEMPLATE_NAME) -> Template:
+    """Return a compiled template, recompiling only when its file has changed.
+
+    One stat per render replaces Jinja's auto_reload lookup path, while edits
+    to the template during development still show up on the next render.
+    """
+    mtime = (_TEMPLATES_DIR / name).stat().st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(name)
+    if cached is not None and cached[1] == mtime:
+        return cached[0]
+    template = _environment().get_template(name)
+    _TEMPLATE_CACHE[name] = (template, mtime)
+    return template
+
+
+def _report_path(output_dir: Path, date: datetime) -> Path:
+    """Where the markdown report for *date* is written."""
+    return output_dir / f"{date.year:04d}-{date.month:02d}-{date.day:02d}.md"
+
+
+def generate_reports(
+    reports: Iterable[tuple[dict[str, Any], datetime | None, dict[str, Any] | None]],
+    output_dir: Path | None = None,
+) -> list[str]:
+    """Render several French learning documents in one pass (e.g. a backfill).
+
+    The template lookup, clock read and output directory setup happen once;
+    only the per-report fields are rebuilt for each render.
+
+    Args:
+        reports: ``(data, date, french_content)`` tuples, with the same meaning
+            as the arguments to :func:`generate_report`.
+        output_dir: Directory to write the report files to, if given.
+
+    Returns:
+        The rendered reports, in input order.
+    """
+    template = _template()
+    # One clock read so the date and the generated-at time can't straddle midnight
+    now = datetime.now()
+    base = {
+        "generated_at": f"{now.hour:02d}:{now.minute:02d}",
+        "fallback_msg": _FALLBACK_MSG,
+    }
+
+    if output_dir:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    rendered_reports = []
+    for data, date, french_content in reports:
+        date = date or now
+        date_str = f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+        rendered = template.render(
+            base,
+            date=date_str,
+            date_fr=french_date(date),
+            data=data,
+            french_content=french_content or {},
+        )
+
+        # Write to file if output_dir specified
+        if output_dir:
+            output_path = _report_path(output_dir, date)
+            _write_bytes(output_path, rendered.encode("utf-8"))
+            logger.info("Report written to %s", output_path)
+
+        rendered_reports.append(rendered)
+
+    return rendered_reports
 
 
 def generate_report(
@@ -86,45 +233,32 @@ def generate_report(
 
     Args:
         data: Dictionary mapping gatherer names to their results.
-        output_dir: Directory to write the report file. Defaults to briefings/.
+        output_dir: Directory to write ``<date>.md`` to. If None, nothing is
+            written and the report is only returned.
         date: Date for the report. Defaults to today.
         french_content: Dict of AI-generated French content (from french_gen).
 
     Returns:
         The rendered report as a string.
     """
-    from morning_report.french_gen import _FALLBACK_MSG
+    return generate_reports([(data, date, french_content)], output_dir=output_dir)[0]
 
-    date = date or datetime.now()
-    date_str = date.strftime("%Y-%m-%d")
 
-    env = Environment(
-        loader=FileSystemLoader(str(_TEMPLATES_DIR)),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    env.filters["weather_fr"] = _weather_fr
-
-    template = env.get_template("french_learning.md.j2")
-
-    rendered = template.render(
-        date=date_str,
-        date_fr=french_date(date),
-        generated_at=datetime.now().strftime("%H:%M"),
-        data=data,
-        french_content=french_content or {},
-        fallback_msg=_FALLBACK_MSG,
-    )
-
-    # Write to file if output_dir specified
-    if output_dir:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / f"{date_str}.md"
-        output_path.write_text(rendered)
-        logger.info("Report written to %s", output_path)
+def write_report(
+    data: dict[str, Any],
+    output_dir: Path,
+    date: datetime | None = None,
+    french_content: dict[str, Any] | None = None,
+) -> Path:
+    """Generate the report like :func:`generate_report` and write it to *output_dir*.
 
-    return rendered
+    Returns:
+        Path to the written ``<date>.md`` file.
+    """
+    date = date or datetime.now()
+    output_dir = Path(output_dir)
+    generate_report(data, output_dir=output_dir, date=date, french_content=french_content)
+    return _report_path(output_dir, date)
 
 
 def save_gathered_data(data: dict[str, Any], output_dir: Path, date: datetime | None = None):
@@ -134,6 +268,5 @@ def save_gathered_data(data: dict[str, Any], output_dir: Path, date: datetime |
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"{date_str}.json"
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    _write_bytes(output_path, jsonio.dumps(data))
     logger.info("Gathered data saved to %s", output_path)
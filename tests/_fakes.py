@@ -0,0 +1,63 @@
+"""Lightweight fakes for third-party objects where a MagicMock would be overkill."""
+
+import json
+from types import SimpleNamespace
+
+
+def fake_feed(entries, title="Test Feed"):
+    """Minimal stand-in for a feedparser result: ``.feed`` and ``.entries``.
+
+    feedparser entries are dict subclasses, so plain dicts are faithful entries.
+    """
+    return SimpleNamespace(feed={"title": title}, entries=[dict(e) for e in entries])
+
+
+class FakeFeedparser:
+    """Stand-in for the ``feedparser`` module.
+
+    ``parse(url)`` returns :attr:`result`, or delegates to :attr:`handler`
+    (which may raise) when one is set.
+    """
+
+    def __init__(self):
+        self.result = None
+        self.handler = None
+
+    def parse(self, url):
+        if self.handler is not None:
+            return self.handler(url)
+        return self.result
+
+
+def fake_response(payload):
+    """Stand-in for a successful ``requests.Response`` carrying *payload*.
+
+    ``.json()`` returns *payload* itself; ``.content`` is its JSON encoding.
+    """
+    return SimpleNamespace(
+        json=lambda: payload,
+        content=json.dumps(payload).encode(),
+        raise_for_status=lambda: None,
+    )
+
+
+class FakeOWM:
+    """Stand-in for the OpenWeatherMap API behind ``requests.Session.get``.
+
+    Set :attr:`payloads` by endpoint (``"weather"``, ``"forecast"``,
+    ``"onecall"``); unset endpoints answer ``{}``. Each request is recorded
+    in :attr:`calls` as ``(endpoint, params)``.
+    """
+
+    def __init__(self):
+        self.payloads = {}
+        self.calls = []
+
+    def get(self, url, params=None, **kwargs):
+        endpoint = url.rsplit("/", 1)[1]
+        self.calls.append((endpoint, params))
+        return fake_response(self.payloads.get(endpoint, {}))
+
+    def endpoints(self):
+        """Endpoints requested so far, sorted (requests run concurrently)."""
+        return sorted(endpoint for endpoint, _ in self.calls)
@@ -0,0 +1,176 @@
+"""Read-only sample data shared between test modules, and small helpers for using it."""
+
+import json
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only copy: dicts become ``MappingProxyType``, lists tuples.
+
+    Shared module-level sample data is frozen so that code under test which
+    mutates its input fails loudly instead of corrupting later tests.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of :func:`freeze`, for code paths that need real dicts/lists (e.g. JSON)."""
+    if isinstance(value, MappingProxyType):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def missing(text: str, expected) -> list[str]:
+    """Return the items of *expected* not found in *text*, so one assert reports them all."""
+    return [s for s in expected if s not in text]
+
+
+# -- Gatherer output (French generation tests) -------------------------------
+
+WEATHER_DATA = freeze({
+    "status": "ok",
+    "locations": {
+        "West Kirby, UK": {
+            "current": {
+                "description": "light rain",
+                "temp": 10.5,
+                "feels_like": 8.2,
+                "humidity": 85,
+                "wind_speed": 4.5,
+            },
+        }
+    },
+})
+
+MARKETS_DATA = freeze({
+    "status": "ok",
+    "crypto": {
+        "bitcoin": {"symbol": "BTC", "price_usd": 67000.00, "change_24h_pct": 1.5},
+        "allora": {"symbol": "ALLO", "price_usd": 0.0234, "change_24h_pct": -3.2},
+    },
+})
+
+MEDITATION_DATA = freeze({
+    "status": "ok",
+    "items": [
+        {
+            "title": "The Power of Letting Go",
+            "summary": "Today's meditation focuses on surrender.",
+            "content": "Richard Rohr reflects on the practice of letting go.",
+            "link": "http://cac.org/meditation",
+        },
+    ],
+})
+
+
+# -- Model output --------------------------------------------------------------
+
+MOCK_API_RESPONSE = freeze({
+    "meditation_fr": "Richard Rohr reflechit sur la pratique du lacher prise.",
+    "history": {
+        "year": 1872,
+        "text": "Le premier parc national au monde, Yellowstone, a ete cree.",
+    },
+    "vocabulary": [
+        {"fr": "la pluie", "en": "rain", "example": "La pluie tombe sur la ville."},
+        {"fr": "le marche", "en": "market", "example": "Le marche est en hausse."},
+    ],
+    "expression": {
+        "fr": "Apres la pluie, le beau temps",
+        "en": "Every cloud has a silver lining",
+        "example": "Ne t'inquiete pas, apres la pluie, le beau temps !",
+    },
+    "grammar": {
+        "rule": "Le passe compose avec 'avoir'",
+        "explanation": "For most verbs, use avoir + past participle.",
+        "examples": ["J'ai reflechi", "Il a lache prise"],
+    },
+    "exercise": {
+        "instruction": "Completez avec le mot correct :",
+        "questions": ["La ___ tombe doucement.", "Le ___ est en hausse."],
+        "answers": ["pluie", "marche"],
+    },
+})
+
+MOCK_API_RESPONSE_JSON = json.dumps(thaw(MOCK_API_RESPONSE))
+
+
+# -- Full report inputs (report generation tests) ----------------------------
+
+SAMPLE_DATA = freeze({
+    "weather": {
+        "status": "ok",
+        "locations": {
+            "West Kirby, UK": {
+                "current": {
+                    "description": "overcast clouds",
+                    "temp": 10.2,
+                    "feels_like": 8.5,
+                    "humidity": 82,
+                    "wind_speed": 5.1,
+                },
+            }
+        },
+    },
+    "markets": {
+        "status": "ok",
+        "crypto": {
+            "bitcoin": {"symbol": "BTC", "price_usd": 67943.50, "change_24h_pct": 2.3},
+            "ethereum": {"symbol": "ETH", "price_usd": 2045.20, "change_24h_pct": -1.1},
+        },
+        "stocks": {},
+    },
+    "meditation": {
+        "status": "ok",
+        "items": [
+            {
+                "title": "The Power of Letting Go",
+                "summary": "Today's meditation focuses on surrender.",
+                "content": "Richard Rohr reflects on the practice of letting go.",
+                "link": "http://cac.org/meditation",
+                "published": "2026-02-26",
+                "source": "Center for Action and Contemplation",
+            },
+        ],
+    },
+})
+
+SAMPLE_FRENCH_CONTENT = freeze({
+    "meditation_fr": "Richard Rohr reflechit sur la pratique du lacher prise.",
+    "poem": {
+        "text": "La pluie tombe doucement\nSur les toits gris du matin",
+        "author": "Paul Verlaine",
+        "title": "Il pleure dans mon coeur",
+        "source": "Romances sans paroles (1874)",
+    },
+    "history": {
+        "year": 1872,
+        "text": "Le premier parc national, Yellowstone, a ete cree.",
+    },
+    "vocabulary": [
+        {"fr": "la pluie", "en": "rain", "example": "La pluie tombe sur la ville."},
+        {"fr": "le marche", "en": "market", "example": "Le marche est en hausse."},
+    ],
+    "expression": {
+        "fr": "Apres la pluie, le beau temps",
+        "en": "Every cloud has a silver lining",
+        "example": "Ne t'inquiete pas, apres la pluie, le beau temps !",
+    },
+    "grammar": {
+        "rule": "Le passe compose avec avoir",
+        "explanation": "Use avoir + past participle for most verbs.",
+        "examples": ["J'ai reflechi", "Il a lache prise"],
+    },
+    "exercise": {
+        "instruction": "Completez avec le mot correct :",
+        "questions": ["La ___ tombe doucement.", "Le ___ est en hausse."],
+        "answers": ["pluie", "marche"],
+    },
+})
@@ -0,0 +1,83 @@
+"""Shared pytest fixtures."""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from ._fakes import FakeFeedparser, FakeOWM
+from ._fixtures import SAMPLE_DATA, thaw
+
+
+def pytest_collection_modifyitems(items):
+    """Give every ``mock_anthropic``-marked test the mock ``anthropic`` module."""
+    for item in items:
+        if item.get_closest_marker("mock_anthropic") and "anthropic_mod" not in item.fixturenames:
+            item.fixturenames.append("anthropic_mod")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _template_cache_dir(tmp_path_factory):
+    """Keep compiled-template cache files out of the user's ``~/.cache``."""
+    from morning_report.report.generator import _TEMPLATE_CACHE_ENV, _environment
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(_TEMPLATE_CACHE_ENV, str(tmp_path_factory.mktemp("template-cache")))
+        _environment.cache_clear()
+        yield
+    _environment.cache_clear()
+
+
+@pytest.fixture
+def anthropic_mod(monkeypatch):
+    """A mock ``anthropic`` module in ``sys.modules`` for one test.
+
+    Requested directly or through the ``mock_anthropic`` marker; monkeypatch
+    restores the previous ``sys.modules`` entry (or its absence) afterwards.
+    """
+    mod = MagicMock()
+    mod.AuthenticationError = type("AuthenticationError", (Exception,), {})
+    monkeypatch.setitem(sys.modules, "anthropic", mod)
+    return mod
+
+
+@pytest.fixture
+def anthropic_client(anthropic_mod):
+    """The mock client returned by ``anthropic.Anthropic()``."""
+    return anthropic_mod.Anthropic.return_value
+
+
+@pytest.fixture
+def fake_feedparser(monkeypatch):
+    """Swap feed_utils' ``feedparser`` module for a :class:`FakeFeedparser`.
+
+    Set ``fake_feedparser.result`` (or ``.handler``) in the test to control
+    what each feed returns.
+    """
+    fake = FakeFeedparser()
+    monkeypatch.setattr("morning_report.gatherers.feed_utils.feedparser", fake)
+    return fake
+
+
+@pytest.fixture
+def owm_stub(monkeypatch):
+    """Answer the weather gatherer's OWM requests from a :class:`FakeOWM`.
+
+    Patched per test, so tests stay independent under ``pytest -n auto``.
+    """
+    fake = FakeOWM()
+    monkeypatch.setattr(
+        "morning_report.gatherers.weather.requests.Session.get",
+        lambda session, url, **kwargs: fake.get(url, **kwargs),
+    )
+    return fake
+
+
+@pytest.fixture
+def sample_data():
+    """A fresh, mutable copy of the frozen ``SAMPLE_DATA``.
+
+    Read-only tests use ``SAMPLE_DATA`` directly; this is for code that needs
+    real dicts (JSON encoding) or tests that modify the data.
+    """
+    return thaw(SAMPLE_DATA)
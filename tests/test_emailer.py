@@ -1,16 +1,28 @@
 """Tests for the email delivery module."""
 
+import email
+import email.policy
+import io
 import json
+import os
+import smtplib
+import subprocess
+import tracemalloc
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from morning_report import jsonio
 from morning_report.report.emailer import (
-    send_report, build_message, _build_summary, _build_subject,
-    get_keychain_password, set_keychain_password, KEYCHAIN_SERVICE,
+    send_report, send_report_many, build_message, _build_summary, _build_subject,
+    get_keychain_password, set_keychain_password, KEYCHAIN_SERVICE, DOCX_MIME,
+    SMTPSession, _summary_data_from_stream, _load_summary_data, _framework_find_password,
 )
 
+from ._fixtures import missing
+
 
 SAMPLE_DATA = {
     "weather": {
@@ -30,27 +42,44 @@ SAMPLE_DATA = {
     },
 }
 
+SAMPLE_JSON_BYTES = json.dumps(SAMPLE_DATA).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory):
+    """Read-only report.docx / report.json pair shared by every test.
+
+    Tests that modify or remove files use their own ``tmp_path`` instead.
+    """
+    d = tmp_path_factory.mktemp("sample")
+    (d / "report.docx").write_bytes(b"fake docx")
+    (d / "report.json").write_bytes(SAMPLE_JSON_BYTES)
+    return d
+
+
+@pytest.fixture(scope="module")
+def sample_message(sample_files):
+    """One message built from ``sample_files``, for tests that only inspect it."""
+    return build_message(sample_files / "report.docx", sample_files / "report.json",
+                         "to@test.com", "from@test.com")
+
 
 class TestBuildSummary:
     def test_includes_meteo(self):
-        summary = _build_summary(SAMPLE_DATA)
-        assert "Meteo" in summary
-        assert "West Kirby" in summary
+        absent = missing(_build_summary(SAMPLE_DATA), ("Meteo", "West Kirby"))
+        assert not absent, absent
 
     def test_includes_marches(self):
-        summary = _build_summary(SAMPLE_DATA)
-        assert "Marches" in summary
-        assert "BTC" in summary
-        assert "ALLO" in summary
+        absent = missing(_build_summary(SAMPLE_DATA), ("Marches", "BTC", "ALLO"))
+        assert not absent, absent
 
     def test_includes_piece_jointe(self):
         summary = _build_summary(SAMPLE_DATA)
         assert "piece jointe" in summary
 
     def test_handles_empty_data(self):
-        summary = _build_summary({})
-        assert "Francais du jour" in summary
-        assert "piece jointe" in summary
+        absent = missing(_build_summary({}), ("Francais du jour", "piece jointe"))
+        assert not absent, absent
 
 
 class TestBuildSubject:
@@ -59,55 +88,220 @@ class TestBuildSubject:
         assert "Francais du jour" in subject
 
 
+class TestSummaryStream:
+    @pytest.fixture(autouse=True)
+    def _require_ijson(self):
+        pytest.importorskip("ijson")
+
+    def test_matches_full_parse(self):
+        data = _summary_data_from_stream(io.BytesIO(SAMPLE_JSON_BYTES))
+        assert _build_summary(data) == _build_summary(SAMPLE_DATA)
+
+    def test_skips_unused_sections(self):
+        full = {**SAMPLE_DATA, "meditation": {"status": "ok", "items": [{"content": "x"}]}}
+        data = _summary_data_from_stream(io.BytesIO(json.dumps(full).encode()))
+        assert set(data) == {"weather", "markets"}
+        assert isinstance(data["weather"]["locations"]["West Kirby, UK"]["current"]["temp"], float)
+
+    def test_large_report_streams_in_bounded_memory(self):
+        padding = [{"title": f"Paper {i}", "abstract": "lorem ipsum " * 20} for i in range(40_000)]
+        raw = json.dumps({"arxiv": {"papers": padding}, **SAMPLE_DATA}).encode()
+        assert len(raw) > 10_000_000
+
+        tracemalloc.start()
+        try:
+            data = _summary_data_from_stream(io.BytesIO(raw))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert _build_summary(data) == _build_summary(SAMPLE_DATA)
+        assert peak < 1_000_000
+
+    def test_invalid_json_raises_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            _summary_data_from_stream(io.BytesIO(b'{"weather": {"status": '))
+
+    def test_small_files_parsed_whole(self, tmp_path):
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        with patch("morning_report.report.emailer._summary_data_from_stream") as mock_stream:
+            assert _load_summary_data(json_path, len(SAMPLE_JSON_BYTES)) == SAMPLE_DATA
+
+        mock_stream.assert_not_called()
+
+    def test_large_files_streamed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("morning_report.report.emailer._STREAM_MIN_BYTES", 0)
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        with patch("morning_report.report.emailer._summary_data_from_stream",
+                   wraps=_summary_data_from_stream) as spy:
+            data = _load_summary_data(json_path, len(SAMPLE_JSON_BYTES))
+
+        spy.assert_called_once()
+        assert _build_summary(data) == _build_summary(SAMPLE_DATA)
+
+
 class TestBuildMessage:
-    def test_message_structure(self, tmp_path):
-        docx_path = tmp_path / "2026-03-01.docx"
-        docx_path.write_bytes(b"fake docx content")
-        json_path = tmp_path / "2026-03-01.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
-
-        msg = build_message(
-            docx_path=docx_path,
-            json_path=json_path,
-            recipient="test@example.com",
-            sender="sender@example.com",
-        )
+    def test_message_structure(self, sample_message):
+        assert "Francais du jour" in sample_message["Subject"]
+        assert sample_message["From"] == "from@test.com"
+        assert sample_message["To"] == "to@test.com"
+
+    def test_has_single_attachment(self, sample_message):
+        parts = list(sample_message.iter_parts())
+        filenames = {p.get_filename() for p in parts} - {None}
+        assert len(parts) == 2  # text body + 1 attachment
+        assert filenames == {"report.docx"}
 
-        assert "Francais du jour" in msg["Subject"]
-        assert msg["From"] == "sender@example.com"
-        assert msg["To"] == "test@example.com"
+    def test_attachment_round_trips(self, tmp_path):
+        docx_bytes = bytes(range(256)) * 4
+        docx_path = tmp_path / "report.docx"
+        docx_path.write_bytes(docx_bytes)
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
+        reparsed = email.message_from_bytes(msg.as_bytes(), policy=email.policy.default)
 
-    def test_has_single_attachment(self, tmp_path):
+        attachment = next(reparsed.iter_attachments())
+        assert attachment.get_content_type() == DOCX_MIME
+        assert attachment.get_content() == docx_bytes
+
+    def test_accepts_str_paths(self, tmp_path):
         docx_path = tmp_path / "report.docx"
-        docx_path.write_bytes(b"fake docx")
+        docx_path.write_bytes(b"docx")
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        msg = build_message(str(docx_path), str(json_path), "to@test.com", "from@test.com")
+
+        assert next(msg.iter_attachments()).get_filename() == "report.docx"
+        assert "BTC" in msg.get_body().get_content()
+
+    def test_large_attachment_encoded_without_raw_copy(self, tmp_path):
+        docx_bytes = os.urandom(10_000_000)
+        docx_path = tmp_path / "big.docx"
+        docx_path.write_bytes(docx_bytes)
         json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        tracemalloc.start()
+        try:
+            msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        attachment = next(msg.iter_attachments())
+        assert attachment.get_payload(decode=True) == docx_bytes
+        # Encoded text (~13.5MB) plus its bytearray staging copy, but no raw 10MB read
+        assert peak < 32_000_000
+        assert max(len(line) for line in attachment.get_payload().splitlines()) == 76
+
+    def test_empty_attachment(self, tmp_path):
+        docx_path = tmp_path / "empty.docx"
+        docx_path.touch()
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
 
         msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
 
-        parts = list(msg.iter_parts())
-        assert len(parts) == 2  # text body + 1 attachment
-        attachment = parts[1]
-        assert attachment.get_filename() == "report.docx"
+        assert next(msg.iter_attachments()).get_payload(decode=True) == b""
+
+    def test_attachment_reencoded_after_rewrite(self, tmp_path):
+        docx_path = tmp_path / "report.docx"
+        docx_path.write_bytes(b"first")
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        build_message(docx_path, json_path, "to@test.com", "from@test.com")
+        docx_path.write_bytes(b"second version")
+        msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
+
+        attachment = next(msg.iter_attachments())
+        assert attachment.get_payload(decode=True) == b"second version"
+
+    def test_body_contains_french_summary(self, sample_message):
+        body = sample_message.get_body(preferencelist=("plain",)).get_content()
+        assert "piece jointe" in body
+
+    def test_in_memory_data_skips_json_file(self, sample_files):
+        with patch("morning_report.report.emailer._load_summary_data") as mock_load:
+            msg = build_message(sample_files / "report.docx", None, "to@test.com", "from@test.com",
+                                data=SAMPLE_DATA)
+
+        mock_load.assert_not_called()
+        body = msg.get_body(preferencelist=("plain",)).get_content()
+        assert body == _build_summary(SAMPLE_DATA) + "\n"
+
+    def test_requires_json_path_or_data(self, sample_files):
+        with pytest.raises(ValueError, match="either json_path or data is required"):
+            build_message(sample_files / "report.docx", None, "to@test.com", "from@test.com")
+
+    def test_summary_reused_for_unchanged_json(self, tmp_path):
+        docx_path = tmp_path / "report.docx"
+        docx_path.write_bytes(b"fake docx")
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+
+        with patch("morning_report.report.emailer._build_summary",
+                   return_value="summary") as mock_summary:
+            build_message(docx_path, json_path, "to@test.com", "from@test.com")
+            build_message(docx_path, json_path, "to@test.com", "from@test.com")
 
-    def test_body_contains_french_summary(self, tmp_path):
+        mock_summary.assert_called_once()
+
+    def test_summary_rebuilt_when_json_changes(self, tmp_path):
         docx_path = tmp_path / "report.docx"
         docx_path.write_bytes(b"fake docx")
         json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
+        build_message(docx_path, json_path, "to@test.com", "from@test.com")
 
+        json_path.write_text(json.dumps({}))
+        os.utime(json_path, ns=(0, json_path.stat().st_mtime_ns + 1_000_000))
         msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
 
         body = msg.get_body(preferencelist=("plain",)).get_content()
-        assert "piece jointe" in body
+        assert "Meteo" not in body
+
+    def test_summary_without_ijson(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("morning_report.report.emailer.ijson", None)
+        docx_path = tmp_path / "report.docx"
+        docx_path.write_bytes(b"fake docx")
+        json_path = tmp_path / "report.json"
+        json_path.write_bytes(SAMPLE_JSON_BYTES)
 
+        msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
 
-class TestSendReport:
-    def test_smtp_calls(self, tmp_path):
+        body = msg.get_body(preferencelist=("plain",)).get_content()
+        assert body == _build_summary(SAMPLE_DATA) + "\n"
+
+    @pytest.mark.parametrize("encoder", ["orjson", "jsonio"])
+    def test_reads_data_saved_by_other_encoders(self, tmp_path, encoder):
+        if encoder == "orjson":
+            orjson = pytest.importorskip("orjson")
+            encoded = orjson.dumps(SAMPLE_DATA, option=orjson.OPT_INDENT_2)
+        else:
+            encoded = jsonio.dumps(SAMPLE_DATA)
         docx_path = tmp_path / "report.docx"
         docx_path.write_bytes(b"fake docx")
         json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+        json_path.write_bytes(encoded)
+
+        msg = build_message(docx_path, json_path, "to@test.com", "from@test.com")
+
+        body = msg.get_body(preferencelist=("plain",)).get_content()
+        assert body == _build_summary(SAMPLE_DATA) + "\n"
+
+
+class TestSendReport:
+    def test_smtp_calls(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
 
         mock_smtp = MagicMock()
         mock_smtp_instance = MagicMock()
@@ -128,31 +322,25 @@ class TestSendReport:
         mock_smtp_instance.login.assert_called_once_with("sender@example.com", "test-password-123")
         mock_smtp_instance.send_message.assert_called_once()
 
-    def test_raises_when_no_password_available(self, tmp_path):
-        docx_path = tmp_path / "report.docx"
-        docx_path.write_bytes(b"fake docx")
-        json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+    def test_raises_when_no_password_available(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
 
         with patch("morning_report.report.emailer.get_keychain_password", return_value=None):
             with pytest.raises(ValueError, match="Gmail app password not found"):
                 send_report(docx_path, json_path, "to@test.com", "from@test.com")
 
-    def test_placeholder_password_falls_through_to_keychain(self, tmp_path):
-        docx_path = tmp_path / "report.docx"
-        docx_path.write_bytes(b"fake docx")
-        json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+    def test_placeholder_password_falls_through_to_keychain(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
 
         with patch("morning_report.report.emailer.get_keychain_password", return_value=None):
             with pytest.raises(ValueError, match="Gmail app password not found"):
                 send_report(docx_path, json_path, "to@test.com", "from@test.com", "${GMAIL_APP_PASSWORD}")
 
-    def test_uses_keychain_when_no_explicit_password(self, tmp_path):
-        docx_path = tmp_path / "report.docx"
-        docx_path.write_bytes(b"fake docx")
-        json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+    def test_uses_keychain_when_no_explicit_password(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
 
         mock_smtp = MagicMock()
         mock_smtp_instance = MagicMock()
@@ -165,28 +353,186 @@ class TestSendReport:
 
         mock_smtp_instance.login.assert_called_once_with("from@test.com", "keychain-pw")
 
-    def test_raises_on_missing_docx(self, tmp_path):
-        json_path = tmp_path / "report.json"
-        json_path.write_text(json.dumps(SAMPLE_DATA))
+    def test_shared_session_logs_in_once(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
+        server = MagicMock()
+        mock_smtp = _mock_smtp_factory(server)
+
+        with patch("morning_report.report.emailer.get_keychain_password") as mock_keychain:
+            with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+                with SMTPSession("from@test.com", "pw") as session:
+                    for i in range(3):
+                        send_report(
+                            docx_path, json_path, f"to{i}@test.com", "from@test.com", smtp=session,
+                        )
+
+        mock_smtp.assert_called_once()
+        server.login.assert_called_once_with("from@test.com", "pw")
+        assert server.send_message.call_count == 3
+        mock_keychain.assert_not_called()
+
+    def test_shared_session_reconnects_when_stale(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+        mock_smtp = _mock_smtp_factory(stale, fresh)
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with SMTPSession("from@test.com", "pw") as session:
+                send_report(docx_path, json_path, "a@test.com", "from@test.com", smtp=session)
+                send_report(docx_path, json_path, "b@test.com", "from@test.com", smtp=session)
+
+        assert mock_smtp.call_count == 2
+        stale.send_message.assert_called_once()
+        fresh.send_message.assert_called_once()
+
+    def test_many_recipients_share_one_connection(self, sample_files):
+        docx_path = sample_files / "report.docx"
+        json_path = sample_files / "report.json"
+        server = MagicMock()
+        mock_smtp = _mock_smtp_factory(server)
+        recipients = ["a@test.com", "b@test.com", "c@test.com"]
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            send_report_many(docx_path, json_path, recipients, "from@test.com", "pw")
+
+        mock_smtp.assert_called_once()
+        server.login.assert_called_once_with("from@test.com", "pw")
+        sent_to = [call[0][0]["To"] for call in server.send_message.call_args_list]
+        assert sent_to == recipients
+
+    def test_many_recipients_build_summary_once(self, sample_files):
+        server = MagicMock()
+        recipients = ["a@test.com", "b@test.com", "c@test.com"]
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", _mock_smtp_factory(server)), \
+                patch("morning_report.report.emailer._build_summary",
+                      return_value="summary") as mock_summary:
+            send_report_many(sample_files / "report.docx", None, recipients, "from@test.com", "pw",
+                             data=SAMPLE_DATA)
+
+        mock_summary.assert_called_once_with(SAMPLE_DATA)
+        assert server.send_message.call_count == 3
+
+    def test_many_recipients_checks_files_before_connecting(self, tmp_path, sample_files):
+        mock_smtp = MagicMock()
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with pytest.raises(FileNotFoundError, match="Word document not found"):
+                send_report_many(tmp_path / "missing.docx", sample_files / "report.json",
+                                 ["a@test.com"], "from@test.com", "pw")
+
+        mock_smtp.assert_not_called()
+
+    def test_raises_on_missing_docx(self, tmp_path, sample_files):
+        json_path = sample_files / "report.json"
         missing_docx = tmp_path / "missing.docx"
 
         with pytest.raises(FileNotFoundError, match="Word document not found"):
             send_report(missing_docx, json_path, "to@test.com", "from@test.com", "password")
 
-    def test_raises_on_missing_json(self, tmp_path):
-        docx_path = tmp_path / "report.docx"
-        docx_path.write_bytes(b"fake docx")
+    def test_raises_on_missing_json(self, tmp_path, sample_files):
+        docx_path = sample_files / "report.docx"
         missing_json = tmp_path / "missing.json"
 
         with pytest.raises(FileNotFoundError, match="JSON data not found"):
             send_report(docx_path, missing_json, "to@test.com", "from@test.com", "password")
 
 
+def _mock_smtp_factory(*instances):
+    """Patchable ``smtplib.SMTP`` whose successive connections yield ``instances``."""
+    mock_smtp = MagicMock()
+    contexts = []
+    for instance in instances:
+        ctx = MagicMock()
+        ctx.__enter__ = MagicMock(return_value=instance)
+        ctx.__exit__ = MagicMock(return_value=False)
+        contexts.append(ctx)
+    mock_smtp.side_effect = contexts
+    return mock_smtp
+
+
+class TestSMTPSession:
+    def test_connects_lazily_and_reuses_connection(self):
+        server = MagicMock()
+        mock_smtp = _mock_smtp_factory(server)
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with SMTPSession("from@test.com", "pw") as session:
+                mock_smtp.assert_not_called()
+                session.send("msg1")
+                session.send("msg2")
+
+        mock_smtp.assert_called_once_with("smtp.gmail.com", 587, timeout=60)
+        server.login.assert_called_once_with("from@test.com", "pw")
+        server.noop.assert_called_once()
+        assert server.send_message.call_count == 2
+
+    def test_reconnects_when_noop_fails(self):
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+        mock_smtp = _mock_smtp_factory(stale, fresh)
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with SMTPSession("from@test.com", "pw") as session:
+                session.send("msg1")
+                session.send("msg2")
+
+        assert mock_smtp.call_count == 2
+        fresh.starttls.assert_called_once()
+        fresh.login.assert_called_once_with("from@test.com", "pw")
+        fresh.send_message.assert_called_once_with("msg2")
+
+    def test_retries_once_when_dropped_during_send(self):
+        dropped, fresh = MagicMock(), MagicMock()
+        dropped.send_message.side_effect = smtplib.SMTPServerDisconnected("gone")
+        mock_smtp = _mock_smtp_factory(dropped, fresh)
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with SMTPSession("from@test.com", "pw") as session:
+                session.send("msg")
+
+        fresh.send_message.assert_called_once_with("msg")
+
+    def test_replaces_idle_connection_without_noop(self):
+        idle, fresh = MagicMock(), MagicMock()
+        mock_smtp = _mock_smtp_factory(idle, fresh)
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with SMTPSession("from@test.com", "pw", max_idle=100) as session:
+                with patch("morning_report.report.emailer.time.monotonic",
+                           side_effect=[0.0, 500.0, 500.0]):
+                    session.send("msg1")
+                    session.send("msg2")
+
+        idle.noop.assert_not_called()
+        fresh.send_message.assert_called_once_with("msg2")
+
+    def test_login_failure_closes_connection(self):
+        server = MagicMock()
+        server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"bad creds")
+        mock_smtp = MagicMock()
+        mock_smtp.return_value.__enter__ = MagicMock(return_value=server)
+        mock_smtp.return_value.__exit__ = MagicMock(return_value=False)
+
+        with patch("morning_report.report.emailer.smtplib.SMTP", mock_smtp):
+            with pytest.raises(smtplib.SMTPAuthenticationError):
+                SMTPSession("from@test.com", "pw").send("msg")
+
+        mock_smtp.return_value.__exit__.assert_called_once()
+
+
 class TestKeychainPassword:
+    @pytest.fixture(autouse=True)
+    def _no_security_framework(self):
+        """Exercise the ``security`` CLI path regardless of platform."""
+        with patch("morning_report.report.emailer._security_lib", return_value=None):
+            yield
+
     def test_get_keychain_password_success(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "my-secret-password\n"
+        mock_result = subprocess.CompletedProcess([], 0, stdout="my-secret-password\n", stderr="")
 
         with patch("morning_report.report.emailer.subprocess.run", return_value=mock_result) as mock_run:
             pw = get_keychain_password("test@example.com")
@@ -199,9 +545,7 @@ class TestKeychainPassword:
         )
 
     def test_get_keychain_password_not_found(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 44
-        mock_result.stdout = ""
+        mock_result = subprocess.CompletedProcess([], 44, stdout="", stderr="")
 
         with patch("morning_report.report.emailer.subprocess.run", return_value=mock_result):
             pw = get_keychain_password("test@example.com")
@@ -209,23 +553,92 @@ class TestKeychainPassword:
         assert pw is None
 
     def test_set_keychain_password_success(self):
-        mock_delete = MagicMock(returncode=0)
-        mock_add = MagicMock(returncode=0, stderr="")
+        mock_add = subprocess.CompletedProcess([], 0, stdout="", stderr="")
 
-        with patch("morning_report.report.emailer.subprocess.run", side_effect=[mock_delete, mock_add]) as mock_run:
+        with patch("morning_report.report.emailer.subprocess.run",
+                   return_value=mock_add) as mock_run:
             set_keychain_password("test@example.com", "new-password")
 
-        assert mock_run.call_args_list[0][0][0] == [
-            "security", "delete-generic-password", "-s", KEYCHAIN_SERVICE, "-a", "test@example.com",
-        ]
-        assert mock_run.call_args_list[1][0][0] == [
-            "security", "add-generic-password", "-s", KEYCHAIN_SERVICE, "-a", "test@example.com", "-w", "new-password",
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "security", "add-generic-password", "-U", "-s", KEYCHAIN_SERVICE,
+            "-a", "test@example.com", "-w", "new-password",
         ]
 
     def test_set_keychain_password_failure(self):
-        mock_delete = MagicMock(returncode=0)
-        mock_add = MagicMock(returncode=1, stderr="some error")
+        mock_add = subprocess.CompletedProcess([], 1, stdout="", stderr="some error")
 
-        with patch("morning_report.report.emailer.subprocess.run", side_effect=[mock_delete, mock_add]):
+        with patch("morning_report.report.emailer.subprocess.run", return_value=mock_add):
             with pytest.raises(RuntimeError, match="Failed to store password"):
                 set_keychain_password("test@example.com", "new-password")
+
+
+class TestKeychainFramework:
+    def test_get_uses_framework_when_available(self):
+        with patch("morning_report.report.emailer._security_lib",
+                   return_value=(MagicMock(), MagicMock())), \
+             patch("morning_report.report.emailer._framework_find_password",
+                   return_value="fw-pw"), \
+             patch("morning_report.report.emailer.subprocess.run") as mock_run:
+            pw = get_keychain_password("test@example.com")
+
+        assert pw == "fw-pw"
+        mock_run.assert_not_called()
+
+    def test_get_falls_back_to_cli_on_framework_error(self):
+        mock_result = MagicMock(returncode=0, stdout="cli-pw\n")
+
+        with patch("morning_report.report.emailer._security_lib",
+                   return_value=(MagicMock(), MagicMock())), \
+             patch("morning_report.report.emailer._framework_find_password",
+                   side_effect=OSError("boom")), \
+             patch("morning_report.report.emailer.subprocess.run", return_value=mock_result):
+            pw = get_keychain_password("test@example.com")
+
+        assert pw == "cli-pw"
+
+    @staticmethod
+    def _sec_returning(status):
+        """A stand-in Security library whose lookups all return *status*."""
+        return SimpleNamespace(
+            SecKeychainFindGenericPassword=lambda *args: status,
+            SecKeychainAddGenericPassword=lambda *args: status,
+        )
+
+    def test_framework_item_not_found_is_none(self):
+        assert _framework_find_password(self._sec_returning(-25300), "test@example.com") is None
+
+    def test_get_falls_back_to_cli_when_interaction_not_allowed(self):
+        mock_result = subprocess.CompletedProcess([], 0, stdout="cli-pw\n", stderr="")
+        sec = self._sec_returning(-25308)  # errSecInteractionNotAllowed
+
+        with patch("morning_report.report.emailer._security_lib",
+                   return_value=(sec, MagicMock())), \
+             patch("morning_report.report.emailer.subprocess.run",
+                   return_value=mock_result) as mock_run:
+            pw = get_keychain_password("test@example.com")
+
+        assert pw == "cli-pw"
+        mock_run.assert_called_once()
+
+    def test_set_falls_back_to_cli_on_framework_status(self):
+        mock_add = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+        sec = self._sec_returning(-25308)
+
+        with patch("morning_report.report.emailer._security_lib",
+                   return_value=(sec, MagicMock())), \
+             patch("morning_report.report.emailer.subprocess.run",
+                   return_value=mock_add) as mock_run:
+            set_keychain_password("test@example.com", "new-password")
+
+        assert mock_run.call_args[0][0][:2] == ["security", "add-generic-password"]
+
+    def test_set_uses_framework_when_available(self):
+        with patch("morning_report.report.emailer._security_lib",
+                   return_value=(MagicMock(), MagicMock())), \
+             patch("morning_report.report.emailer._framework_set_password") as mock_set, \
+             patch("morning_report.report.emailer.subprocess.run") as mock_run:
+            set_keychain_password("test@example.com", "new-password")
+
+        assert mock_set.call_args[0][2:] == ("test@example.com", "new-password")
+        mock_run.assert_not_called()
@@ -1,11 +1,16 @@
 """Tests for the Word document exporter."""
 
+import base64
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
+import requests
 
-from morning_report.report.exporter import export_docx
+from morning_report.report.exporter import (
+    export_docx, export_docx_many, generate_and_export_all, _pandoc_server_url,
+)
 
 
 class TestExportDocx:
@@ -75,3 +80,306 @@ class TestExportDocx:
 
         assert result.suffix == ".docx"
         assert result.stem == "2026-02-25"
+
+    def test_bytes_input_piped_to_stdin(self, tmp_path):
+        output = tmp_path / "report.docx"
+        mock_result = MagicMock(returncode=0, stderr=b"")
+
+        with patch("morning_report.report.exporter.subprocess.run",
+                   return_value=mock_result) as mock_run:
+            result = export_docx("# Rapport — été".encode(), output_path=output)
+
+        mock_run.assert_called_once_with(
+            ["pandoc", "-o", str(output), "--from=markdown", "--to=docx"],
+            input="# Rapport — été".encode(),
+            capture_output=True,
+        )
+        assert result == output
+        assert list(tmp_path.iterdir()) == []  # no intermediate markdown file
+
+    def test_bytes_input_failure_decodes_stderr(self, tmp_path):
+        mock_result = MagicMock(returncode=64, stderr=b"bad input\n")
+
+        with patch("morning_report.report.exporter.subprocess.run", return_value=mock_result):
+            with pytest.raises(RuntimeError, match="exit 64.*bad input"):
+                export_docx(b"# Report", output_path=tmp_path / "out.docx")
+
+    def test_bytes_input_requires_output_path(self):
+        with pytest.raises(ValueError, match="output_path is required"):
+            export_docx(b"# Report")
+
+
+class TestExportDocxMany:
+    def _make_proc(self, events, name, returncode=0, stderr=""):
+        proc = MagicMock()
+        proc.returncode = returncode
+
+        def communicate():
+            events.append(("wait", name))
+            return "", stderr
+
+        proc.communicate.side_effect = communicate
+        return proc
+
+    def test_starts_all_before_waiting(self, tmp_path):
+        md_a = tmp_path / "2026-02-25.md"
+        md_b = tmp_path / "2026-02-26.md"
+        md_a.write_text("# A")
+        md_b.write_text("# B")
+        events = []
+
+        def fake_popen(args, **kwargs):
+            events.append(("start", Path(args[1]).name))
+            return self._make_proc(events, Path(args[1]).name)
+
+        with patch("morning_report.report.exporter.subprocess.Popen", side_effect=fake_popen):
+            result = export_docx_many([md_a, md_b])
+
+        assert result == [tmp_path / "2026-02-25.docx", tmp_path / "2026-02-26.docx"]
+        assert [e[0] for e in events] == ["start", "start", "wait", "wait"]
+
+    def test_pandoc_args_match_single_export(self, tmp_path):
+        md_file = tmp_path / "report.md"
+        md_file.write_text("# Report")
+        out = tmp_path / "out.docx"
+
+        with patch("morning_report.report.exporter.subprocess.Popen",
+                   return_value=self._make_proc([], "report.md")) as mock_popen:
+            export_docx_many([md_file], [out])
+
+        assert mock_popen.call_args[0][0] == [
+            "pandoc", str(md_file), "-o", str(out), "--from=markdown", "--to=docx",
+        ]
+
+    def test_raises_runtime_error_on_any_failure(self, tmp_path):
+        md_a = tmp_path / "a.md"
+        md_b = tmp_path / "b.md"
+        md_a.write_text("# A")
+        md_b.write_text("# B")
+        procs = [self._make_proc([], "a.md"), self._make_proc([], "b.md", 1, "bad input")]
+
+        with patch("morning_report.report.exporter.subprocess.Popen", side_effect=procs):
+            with pytest.raises(RuntimeError, match="b.md .exit 1.: bad input"):
+                export_docx_many([md_a, md_b])
+
+    def test_raises_file_not_found_before_starting(self, tmp_path):
+        with patch("morning_report.report.exporter.subprocess.Popen") as mock_popen:
+            with pytest.raises(FileNotFoundError, match="Markdown file not found"):
+                export_docx_many([tmp_path / "missing.md"])
+        mock_popen.assert_not_called()
+
+    def test_mismatched_output_paths(self, tmp_path):
+        md_file = tmp_path / "report.md"
+        md_file.write_text("# Report")
+
+        with pytest.raises(ValueError):
+            export_docx_many([md_file], [])
+
+
+class TestPythonDocxEngine:
+    MARKDOWN = (
+        "# Francais du jour — jeudi 26 fevrier 2026\n"
+        "\n"
+        "*Genere a 05:00*\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## Marches\n"
+        "\n"
+        "| Jeton | Prix (USD) |\n"
+        "|-------|------------|\n"
+        "| **bitcoin** | $67943.50 |\n"
+        "\n"
+        "> Indices indisponibles\n"
+        "\n"
+        "- *J'ai reflechi*\n"
+        "1. La ___ tombe.\n"
+        "\n"
+        "<details>\n"
+        "<summary>Reponses</summary>\n"
+        "</details>\n"
+        "\n"
+        "Line one\n"
+        "line two with [a link](http://example.com)\n"
+    )
+
+    def test_writes_document_without_pandoc(self, tmp_path):
+        docx = pytest.importorskip("docx")
+        md_file = tmp_path / "report.md"
+        md_file.write_text(self.MARKDOWN)
+
+        with patch("morning_report.report.exporter.subprocess.run") as mock_run:
+            result = export_docx(md_file, engine="python-docx")
+
+        mock_run.assert_not_called()
+        document = docx.Document(str(result))
+        paragraphs = [(p.style.name, p.text) for p in document.paragraphs if p.text]
+        assert ("Heading 1", "Francais du jour — jeudi 26 fevrier 2026") in paragraphs
+        assert ("Heading 2", "Marches") in paragraphs
+        assert ("Quote", "Indices indisponibles") in paragraphs
+        assert ("List Bullet", "J'ai reflechi") in paragraphs
+        assert ("List Paragraph", "1. La ___ tombe.") in paragraphs
+        assert ("Normal", "Reponses") in paragraphs
+        assert not any("<" in text for _, text in paragraphs)
+        assert ("Normal", "Line one line two with a link") in paragraphs
+
+        table = document.tables[0]
+        assert [c.text for c in table.rows[0].cells] == ["Jeton", "Prix (USD)"]
+        assert [c.text for c in table.rows[1].cells] == ["bitcoin", "$67943.50"]
+        assert table.rows[1].cells[0].paragraphs[0].runs[0].bold
+
+    def test_inline_markup(self, tmp_path):
+        docx = pytest.importorskip("docx")
+        md_file = tmp_path / "report.md"
+        md_file.write_text("**Bold** and *italic*\n")
+
+        document = docx.Document(str(export_docx(md_file, engine="python-docx")))
+
+        runs = document.paragraphs[0].runs
+        assert (runs[0].text, runs[0].bold) == ("Bold", True)
+        assert (runs[2].text, runs[2].italic) == ("italic", True)
+
+    def test_bytes_input(self, tmp_path):
+        docx = pytest.importorskip("docx")
+        output = tmp_path / "report.docx"
+
+        export_docx("# Été\n".encode(), output_path=output, engine="python-docx")
+
+        assert docx.Document(str(output)).paragraphs[0].text == "Été"
+
+    def test_unknown_engine(self, tmp_path):
+        md_file = tmp_path / "report.md"
+        md_file.write_text("# Report")
+
+        with pytest.raises(ValueError, match="Unknown export engine"):
+            export_docx(md_file, engine="libreoffice")
+
+
+class TestPandocServerEngine:
+    URL = "http://127.0.0.1:3030"
+
+    def _response(self, status=200, body=None, text=""):
+        response = MagicMock(status_code=status, text=text)
+        response.json.return_value = body
+        return response
+
+    def test_posts_markdown_and_writes_decoded_docx(self, tmp_path):
+        md_file = tmp_path / "report.md"
+        md_file.write_text("# Rapport")
+        body = {"output": base64.b64encode(b"PK docx").decode(), "base64": True, "messages": []}
+
+        with patch("morning_report.report.exporter._pandoc_server_url", return_value=self.URL), \
+             patch("morning_report.report.exporter.requests.post",
+                   return_value=self._response(body=body)) as mock_post, \
+             patch("morning_report.report.exporter.subprocess.run") as mock_run:
+            result = export_docx(md_file, engine="pandoc-server")
+
+        mock_run.assert_not_called()
+        assert mock_post.call_args[0][0] == self.URL
+        assert mock_post.call_args[1]["json"] == {
+            "text": "# Rapport", "from": "markdown", "to": "docx",
+        }
+        assert result == tmp_path / "report.docx"
+        assert result.read_bytes() == b"PK docx"
+
+    def test_server_error_raises(self, tmp_path):
+        with patch("morning_report.report.exporter._pandoc_server_url", return_value=self.URL), \
+             patch("morning_report.report.exporter.requests.post",
+                   return_value=self._response(status=500, text="Unknown reader")):
+            with pytest.raises(RuntimeError,
+                               match="pandoc server failed \\(500\\): Unknown reader"):
+                export_docx(b"# Report", output_path=tmp_path / "out.docx", engine="pandoc-server")
+
+    def test_falls_back_to_subprocess_without_server(self, tmp_path):
+        md_file = tmp_path / "report.md"
+        md_file.write_text("# Report")
+        mock_result = MagicMock(returncode=0, stderr="")
+
+        with patch("morning_report.report.exporter._pandoc_server_url", return_value=None), \
+             patch("morning_report.report.exporter.subprocess.run",
+                   return_value=mock_result) as mock_run:
+            export_docx(md_file, engine="pandoc-server")
+
+        assert mock_run.call_args[0][0][:2] == ["pandoc", str(md_file)]
+
+    def test_falls_back_when_server_unreachable(self, tmp_path):
+        md_file = tmp_path / "report.md"
+        md_file.write_text("# Report")
+        mock_result = MagicMock(returncode=0, stderr="")
+
+        with patch("morning_report.report.exporter._pandoc_server_url", return_value=self.URL), \
+             patch("morning_report.report.exporter.requests.post",
+                   side_effect=requests.ConnectionError("refused")), \
+             patch("morning_report.report.exporter.subprocess.run",
+                   return_value=mock_result) as mock_run:
+            export_docx(md_file, engine="pandoc-server")
+
+        mock_run.assert_called_once()
+
+    def test_server_url_none_when_pandoc_too_old(self):
+        proc = MagicMock()
+        proc.poll.return_value = 2  # pandoc 2.x: unknown "server" argument
+        _pandoc_server_url.cache_clear()
+        try:
+            with patch("morning_report.report.exporter.subprocess.Popen", return_value=proc), \
+                 patch("morning_report.report.exporter.atexit.register"):
+                assert _pandoc_server_url() is None
+        finally:
+            _pandoc_server_url.cache_clear()
+
+    def test_server_url_none_when_pandoc_missing(self):
+        _pandoc_server_url.cache_clear()
+        try:
+            with patch("morning_report.report.exporter.subprocess.Popen",
+                       side_effect=FileNotFoundError("pandoc")):
+                assert _pandoc_server_url() is None
+        finally:
+            _pandoc_server_url.cache_clear()
+
+
+class TestGenerateAndExportAll:
+    def test_renders_and_exports_each_report(self, tmp_path):
+        mock_result = MagicMock(returncode=0, stderr="")
+        reports = [
+            ({}, datetime(2026, 2, 25), {}),
+            ({}, datetime(2026, 2, 26), None),
+        ]
+
+        with patch("morning_report.report.exporter.subprocess.run",
+                   return_value=mock_result) as mock_run:
+            result = generate_and_export_all(reports, tmp_path)
+
+        assert result == [tmp_path / "2026-02-25.docx", tmp_path / "2026-02-26.docx"]
+        assert (tmp_path / "2026-02-25.md").exists()
+        assert (tmp_path / "2026-02-26.md").exists()
+        exported = sorted(call[0][0][1] for call in mock_run.call_args_list)
+        assert exported == [str(tmp_path / "2026-02-25.md"), str(tmp_path / "2026-02-26.md")]
+
+    def test_none_date_means_today(self, tmp_path):
+        mock_result = MagicMock(returncode=0, stderr="")
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        with patch("morning_report.report.exporter.subprocess.run", return_value=mock_result):
+            result = generate_and_export_all([({}, None, None)], tmp_path)
+
+        assert result == [tmp_path / f"{today}.docx"]
+        assert (tmp_path / f"{today}.md").exists()
+
+    @pytest.mark.parametrize("dates", [
+        (None, None),
+        (datetime(2026, 2, 25, 6), datetime(2026, 2, 25, 18)),
+    ])
+    def test_same_day_reports_rejected(self, tmp_path, dates):
+        with patch("morning_report.report.exporter.subprocess.run") as mock_run:
+            with pytest.raises(ValueError, match="same file"):
+                generate_and_export_all([({}, date, None) for date in dates], tmp_path)
+
+        mock_run.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_failure_propagates(self, tmp_path):
+        mock_result = MagicMock(returncode=1, stderr="boom")
+
+        with patch("morning_report.report.exporter.subprocess.run", return_value=mock_result):
+            with pytest.raises(RuntimeError, match="pandoc failed"):
+                generate_and_export_all([({}, datetime(2026, 2, 25), {})], tmp_path)
@@ -1,10 +1,28 @@
 """Tests for RSS feed parsing utilities."""
 
-from unittest.mock import patch, MagicMock
+import threading
+import time
 
+import pytest
+
+from morning_report.gatherers import feed_utils
 from morning_report.gatherers.feed_utils import strip_html, trim_article_content, parse_feeds
 
+from ._fakes import fake_feed
+
+
+@pytest.fixture(params=["selectolax", "regex"])
+def html_backend(request, monkeypatch):
+    """Run each test against both the selectolax parser and the regex fallback."""
+    if request.param == "selectolax":
+        if feed_utils.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+    else:
+        monkeypatch.setattr(feed_utils, "LexborHTMLParser", None)
+    return request.param
 
+
+@pytest.mark.usefixtures("html_backend")
 class TestStripHtml:
     def test_removes_tags(self):
         assert strip_html("<p>Hello <b>world</b></p>") == "Hello world"
@@ -18,12 +36,31 @@ class TestStripHtml:
     def test_collapses_whitespace(self):
         assert strip_html("<p>Line one</p>\n\n<p>Line two</p>") == "Line one Line two"
 
+    def test_decodes_entities(self):
+        assert strip_html("<p>Fish &amp; chips</p>") == "Fish & chips"
+        assert strip_html("one&nbsp;two &lt;b&gt;") == "one two <b>"
+
+    def test_keeps_bare_angle_brackets(self):
+        assert strip_html("<p>1 < 2 and 3 > 2</p>") == "1 < 2 and 3 > 2"
+
+    def test_drops_comments(self):
+        assert strip_html("a<!-- <b>hidden</b> -->b") == "ab"
+
     def test_empty_string(self):
         assert strip_html("") == ""
 
     def test_self_closing_tags(self):
         assert strip_html("Hello<br/>World") == "HelloWorld"
 
+    def test_collapses_tabs_and_edges(self):
+        assert strip_html("  <p>\tone\r\n two </p>  ") == "one two"
+
+    def test_large_fragment(self):
+        html = "<div>" + "<p>Para <em>text</em> here.</p>\n" * 4000 + "</div>"
+        assert len(html) > 100_000
+        result = strip_html(html)
+        assert result == " ".join(["Para text here."] * 4000)
+
 
 class TestTrimArticleContent:
     def test_trims_at_image_credit(self):
@@ -67,124 +104,113 @@ class TestTrimArticleContent:
 
 
 class TestParseFeeds:
-    def _make_mock_feed(self, entries, feed_title="Test Feed"):
-        mock_feed = MagicMock()
-        mock_feed.feed.get.return_value = feed_title
-        mock_feed.entries = entries
-        return mock_feed
-
-    def _make_mock_entry(self, data):
-        entry = MagicMock()
-        entry.get.side_effect = lambda key, default="": data.get(key, default)
-        return entry
-
-    def test_basic_parsing(self):
-        entry = self._make_mock_entry({
+    def test_basic_parsing(self, fake_feedparser):
+        fake_feedparser.result = fake_feed([{
             "title": "Test Article",
             "link": "http://example.com",
             "published": "2026-03-01",
             "summary": "A summary.",
-        })
-        mock_feed = self._make_mock_feed([entry])
-        mock_feedparser = MagicMock()
-        mock_feedparser.parse.return_value = mock_feed
+        }])
 
-        with patch.dict("sys.modules", {"feedparser": mock_feedparser}):
-            with patch("morning_report.gatherers.feed_utils.feedparser", mock_feedparser, create=True):
-                result = parse_feeds({"News": ["http://example.com/rss"]})
+        result = parse_feeds({"News": ["http://example.com/rss"]})
 
         assert "News" in result
         assert len(result["News"]) == 1
         assert result["News"][0]["title"] == "Test Article"
         assert result["News"][0]["summary"] == "A summary."
 
-    def test_content_extraction(self):
-        entry = self._make_mock_entry({
+    def test_content_extraction(self, fake_feedparser):
+        fake_feedparser.result = fake_feed([{
             "title": "Article",
             "link": "http://example.com",
             "published": "2026-03-01",
             "summary": "Brief",
             "content": [{"value": "<p>Full <b>content</b> here.</p>"}],
-        })
-        mock_feed = self._make_mock_feed([entry])
-        mock_feedparser = MagicMock()
-        mock_feedparser.parse.return_value = mock_feed
+        }])
 
-        with patch.dict("sys.modules", {"feedparser": mock_feedparser}):
-            with patch("morning_report.gatherers.feed_utils.feedparser", mock_feedparser, create=True):
-                result = parse_feeds({"Test": ["http://example.com/rss"]})
+        result = parse_feeds({"Test": ["http://example.com/rss"]})
 
         assert result["Test"][0]["content"] == "Full content here."
 
-    def test_missing_summary_excluded(self):
-        entry = self._make_mock_entry({
+    def test_missing_summary_excluded(self, fake_feedparser):
+        fake_feedparser.result = fake_feed([{
             "title": "No Summary",
             "link": "http://example.com",
             "published": "2026-03-01",
-        })
-        mock_feed = self._make_mock_feed([entry])
-        mock_feedparser = MagicMock()
-        mock_feedparser.parse.return_value = mock_feed
+        }])
 
-        with patch.dict("sys.modules", {"feedparser": mock_feedparser}):
-            with patch("morning_report.gatherers.feed_utils.feedparser", mock_feedparser, create=True):
-                result = parse_feeds({"Test": ["http://example.com/rss"]})
+        result = parse_feeds({"Test": ["http://example.com/rss"]})
 
         assert "summary" not in result["Test"][0]
         assert "content" not in result["Test"][0]
 
-    def test_max_per_category(self):
-        entries = [
-            self._make_mock_entry({
+    def test_max_per_category(self, fake_feedparser):
+        fake_feedparser.result = fake_feed([
+            {
                 "title": f"Article {i}",
                 "link": f"http://example.com/{i}",
                 "published": "2026-03-01",
-            })
+            }
             for i in range(10)
-        ]
-        mock_feed = self._make_mock_feed(entries)
-        mock_feedparser = MagicMock()
-        mock_feedparser.parse.return_value = mock_feed
+        ])
 
-        with patch.dict("sys.modules", {"feedparser": mock_feedparser}):
-            with patch("morning_report.gatherers.feed_utils.feedparser", mock_feedparser, create=True):
-                result = parse_feeds({"Test": ["http://example.com/rss"]}, max_per_category=3)
+        result = parse_feeds({"Test": ["http://example.com/rss"]}, max_per_category=3)
 
         assert len(result["Test"]) == 3
 
-    def test_multiple_categories(self):
-        entry = self._make_mock_entry({
+    def test_multiple_categories(self, fake_feedparser):
+        fake_feedparser.result = fake_feed([{
             "title": "Item",
             "link": "http://example.com",
             "published": "2026-03-01",
-        })
-        mock_feed = self._make_mock_feed([entry])
-        mock_feedparser = MagicMock()
-        mock_feedparser.parse.return_value = mock_feed
+        }])
 
-        with patch.dict("sys.modules", {"feedparser": mock_feedparser}):
-            with patch("morning_report.gatherers.feed_utils.feedparser", mock_feedparser, create=True):
-                result = parse_feeds({
-                    "Cat A": ["http://a.com/rss"],
-                    "Cat B": ["http://b.com/rss"],
-                })
+        result = parse_feeds({
+            "Cat A": ["http://a.com/rss"],
+            "Cat B": ["http://b.com/rss"],
+        })
 
         assert "Cat A" in result
         assert "Cat B" in result
 
-    def test_feedparser_not_installed(self):
-        with patch.dict("sys.modules", {"feedparser": None}):
-            with patch("builtins.__import__", side_effect=ImportError("No module")):
-                # parse_feeds handles the ImportError internally
-                result = parse_feeds({"Test": ["http://example.com/rss"]})
+    def test_feedparser_not_installed(self, monkeypatch):
+        monkeypatch.setattr(feed_utils, "feedparser", None)
+        result = parse_feeds({"Test": ["http://example.com/rss"]})
         assert "_error" in result
 
-    def test_feed_parse_error_handled(self):
-        mock_feedparser = MagicMock()
-        mock_feedparser.parse.side_effect = Exception("Network error")
+    def test_feed_parse_error_handled(self, fake_feedparser):
+        def parse(url):
+            raise Exception("Network error")
+
+        fake_feedparser.handler = parse
 
-        with patch.dict("sys.modules", {"feedparser": mock_feedparser}):
-            with patch("morning_report.gatherers.feed_utils.feedparser", mock_feedparser, create=True):
-                result = parse_feeds({"Test": ["http://example.com/rss"]})
+        result = parse_feeds({"Test": ["http://example.com/rss"]})
 
         assert result["Test"] == []
+
+    def test_feeds_fetched_concurrently(self, fake_feedparser):
+        # Each parse waits for the other: a serial implementation breaks the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def parse(url):
+            barrier.wait()
+            return fake_feed([{"title": url, "link": url, "published": ""}])
+
+        fake_feedparser.handler = parse
+
+        result = parse_feeds({"Cat A": ["http://a.com/rss"], "Cat B": ["http://b.com/rss"]})
+
+        assert [i["title"] for i in result["Cat A"]] == ["http://a.com/rss"]
+        assert [i["title"] for i in result["Cat B"]] == ["http://b.com/rss"]
+
+    def test_slow_feed_keeps_url_order(self, fake_feedparser):
+        def parse(url):
+            if url.endswith("slow"):
+                time.sleep(0.05)
+            return fake_feed([{"title": url, "link": url, "published": ""}])
+
+        fake_feedparser.handler = parse
+
+        result = parse_feeds({"News": ["http://x.com/slow", "http://x.com/fast"]})
+
+        assert [i["title"] for i in result["News"]] == ["http://x.com/slow", "http://x.com/fast"]
@@ -2,8 +2,10 @@
 
 import json
 import subprocess
+import sys
 from datetime import datetime
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -14,76 +16,21 @@ from morning_report.french_gen import (
     _extract_json,
     _weather_summary,
     _markets_summary,
+    _format_price,
     _meditation_text,
     _EXPECTED_KEYS,
     _FALLBACK_MSG,
     _MODEL_PRICING,
 )
 
-
-# -- Sample data ---------------------------------------------------------------
-
-WEATHER_DATA = {
-    "status": "ok",
-    "locations": {
-        "West Kirby, UK": {
-            "current": {
-                "description": "light rain",
-                "temp": 10.5,
-                "feels_like": 8.2,
-                "humidity": 85,
-                "wind_speed": 4.5,
-            },
-        }
-    },
-}
-
-MARKETS_DATA = {
-    "status": "ok",
-    "crypto": {
-        "bitcoin": {"symbol": "BTC", "price_usd": 67000.00, "change_24h_pct": 1.5},
-        "allora": {"symbol": "ALLO", "price_usd": 0.0234, "change_24h_pct": -3.2},
-    },
-}
-
-MEDITATION_DATA = {
-    "status": "ok",
-    "items": [
-        {
-            "title": "The Power of Letting Go",
-            "summary": "Today's meditation focuses on surrender.",
-            "content": "Richard Rohr reflects on the practice of letting go.",
-            "link": "http://cac.org/meditation",
-        },
-    ],
-}
-
-MOCK_API_RESPONSE = {
-    "meditation_fr": "Richard Rohr reflechit sur la pratique du lacher prise.",
-    "history": {
-        "year": 1872,
-        "text": "Le premier parc national au monde, Yellowstone, a ete cree.",
-    },
-    "vocabulary": [
-        {"fr": "la pluie", "en": "rain", "example": "La pluie tombe sur la ville."},
-        {"fr": "le marche", "en": "market", "example": "Le marche est en hausse."},
-    ],
-    "expression": {
-        "fr": "Apres la pluie, le beau temps",
-        "en": "Every cloud has a silver lining",
-        "example": "Ne t'inquiete pas, apres la pluie, le beau temps !",
-    },
-    "grammar": {
-        "rule": "Le passe compose avec 'avoir'",
-        "explanation": "For most verbs, use avoir + past participle.",
-        "examples": ["J'ai reflechi", "Il a lache prise"],
-    },
-    "exercise": {
-        "instruction": "Completez avec le mot correct :",
-        "questions": ["La ___ tombe doucement.", "Le ___ est en hausse."],
-        "answers": ["pluie", "marche"],
-    },
-}
+from ._fixtures import (
+    MARKETS_DATA,
+    MEDITATION_DATA,
+    MOCK_API_RESPONSE,
+    MOCK_API_RESPONSE_JSON,
+    WEATHER_DATA,
+    thaw,
+)
 
 
 # -- Helper function tests ----------------------------------------------------
@@ -101,6 +48,13 @@ class TestWeatherSummary:
     def test_empty_locations(self):
         assert _weather_summary({"status": "ok", "locations": {}}) == "Weather data unavailable."
 
+    def test_skips_locations_without_current(self):
+        data = {"status": "ok", "locations": {
+            "Nowhere": {"error": "not found"},
+            "Paris, FR": {"current": {"description": "clear sky", "temp": 12}},
+        }}
+        assert _weather_summary(data) == "Paris, FR: clear sky, 12°C"
+
 
 class TestMarketsSummary:
     def test_ok_data(self):
@@ -119,6 +73,20 @@ class TestMarketsSummary:
         result = _markets_summary(MARKETS_DATA)
         assert "$0.0234" in result
 
+    def test_skips_coins_without_price(self):
+        data = {"status": "ok", "crypto": {"x": {"symbol": "x", "price_usd": None}}}
+        assert _markets_summary(data) == "Markets data unavailable."
+
+
+@pytest.mark.parametrize("price, expected", [
+    (67000.0, "$67,000"),
+    (100, "$100"),
+    (99.5, "$99.5000"),
+    (0.0234, "$0.0234"),
+])
+def test_format_price(price, expected):
+    assert _format_price(price) == expected
+
 
 class TestMeditationText:
     def test_uses_content_over_summary(self):
@@ -156,6 +124,13 @@ class TestExtractJson:
         result = _extract_json(wrapped)
         assert result == {"key": "value"}
 
+    def test_code_block_after_prose(self):
+        wrapped = 'Voici le contenu :\n  ```\n{"key": "value"}\n  ```\nBonne journee'
+        assert _extract_json(wrapped) == {"key": "value"}
+
+    def test_unclosed_code_block(self):
+        assert _extract_json('```json\n{"key": "value"}') == {"key": "value"}
+
     def test_fallback_raw_text(self):
         result = _extract_json("This is not JSON at all")
         assert result["meditation_fr"] == "This is not JSON at all"
@@ -223,9 +198,10 @@ class TestGenerateViaClaudeCode:
     """Tests for the claude-code backend (subprocess calling ``claude -p``)."""
 
     def _mock_proc(self, result_dict, returncode=0, stderr=""):
-        """Create a mock CompletedProcess with a CLI JSON envelope."""
-        envelope = {"result": json.dumps(result_dict), "is_error": False}
-        return MagicMock(
+        """Create a CompletedProcess carrying a CLI JSON envelope."""
+        envelope = {"result": json.dumps(thaw(result_dict)), "is_error": False}
+        return subprocess.CompletedProcess(
+            args=["claude"],
             returncode=returncode,
             stdout=json.dumps(envelope),
             stderr=stderr,
@@ -294,7 +270,7 @@ class TestGenerateViaClaudeCode:
             assert result[key] == _FALLBACK_MSG
 
     def test_nonzero_exit(self):
-        proc = MagicMock(returncode=1, stdout="", stderr="Something went wrong")
+        proc = subprocess.CompletedProcess(["claude"], 1, stdout="", stderr="Something went wrong")
         with patch("morning_report.french_gen.subprocess.run", return_value=proc), \
              patch(
                 "morning_report.french_gen._generate_via_api",
@@ -333,50 +309,43 @@ class TestGenerateViaClaudeCode:
         assert args[model_idx + 1] == "opus"
 
 
+def _make_mock_response(content_dict=None, input_tokens=500, output_tokens=1500):
+    """Build a ``messages.create`` response carrying *content_dict* as text.
+
+    Defaults to ``MOCK_API_RESPONSE``, serialised once at import.
+    """
+    text = MOCK_API_RESPONSE_JSON if content_dict is None else json.dumps(content_dict)
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
+
+
+@pytest.mark.mock_anthropic
 class TestFallbackChain:
     """Tests for the claude-code → api fallback chain."""
 
-    def _make_mock_response(self, content_dict, input_tokens=500, output_tokens=1500):
-        mock_response = MagicMock()
-        mock_block = MagicMock()
-        mock_block.type = "text"
-        mock_block.text = json.dumps(content_dict)
-        mock_response.content = [mock_block]
-        mock_response.usage.input_tokens = input_tokens
-        mock_response.usage.output_tokens = output_tokens
-        return mock_response
-
-    def _make_mock_anthropic(self, mock_client=None):
-        mock_mod = MagicMock()
-        if mock_client:
-            mock_mod.Anthropic.return_value = mock_client
-        mock_mod.AuthenticationError = type("AuthenticationError", (Exception,), {})
-        return mock_mod
-
-    def test_timeout_triggers_api_fallback(self):
+    def test_timeout_triggers_api_fallback(self, anthropic_client):
         """When claude-code times out, the API backend is tried and succeeds."""
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(MOCK_API_RESPONSE)
-        mock_mod = self._make_mock_anthropic(mock_client)
+        anthropic_client.messages.create.return_value = _make_mock_response()
 
         with patch(
             "morning_report.french_gen.subprocess.run",
             side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300),
         ):
-            with patch.dict("sys.modules", {"anthropic": mock_mod}):
-                result = generate_french_content(
-                    WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                    backend="claude-code",
-                    api_key="test-key",
-                    date=datetime(2026, 3, 1),
-                )
+            result = generate_french_content(
+                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+                backend="claude-code",
+                api_key="test-key",
+                date=datetime(2026, 3, 1),
+            )
 
         assert result["meditation_fr"] == MOCK_API_RESPONSE["meditation_fr"]
         assert "_error" not in result
         assert result["_backend"] == "api"
         assert result["_model"] == "claude-sonnet-4-6"
 
-    def test_fallback_stamps_poem(self):
+    def test_fallback_stamps_poem(self, anthropic_client):
         """When falling back to API, the poem is still stamped on the result."""
         poem = {
             "title": "Le Lac",
@@ -385,100 +354,71 @@ class TestFallbackChain:
             "excerpt": "O temps ! suspends ton vol",
             "themes": ["temps"],
         }
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(MOCK_API_RESPONSE)
-        mock_mod = self._make_mock_anthropic(mock_client)
+        anthropic_client.messages.create.return_value = _make_mock_response()
 
         with patch(
             "morning_report.french_gen.subprocess.run",
             side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300),
         ):
-            with patch.dict("sys.modules", {"anthropic": mock_mod}):
-                result = generate_french_content(
-                    WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                    backend="claude-code",
-                    api_key="test-key",
-                    date=datetime(2026, 3, 1),
-                    poem=poem,
-                )
+            result = generate_french_content(
+                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+                backend="claude-code",
+                api_key="test-key",
+                date=datetime(2026, 3, 1),
+                poem=poem,
+            )
 
         assert result["_backend"] == "api"
         assert result["poem"]["text"] == poem["excerpt"]
         assert result["poem"]["author"] == poem["author"]
         assert result["poem"]["title"] == poem["title"]
 
-    def test_both_backends_fail(self):
+    def test_both_backends_fail(self, anthropic_client):
         """When both claude-code and API fail, error result is returned."""
-        mock_client = MagicMock()
-        mock_client.messages.create.side_effect = Exception("API also failed")
-        mock_mod = self._make_mock_anthropic(mock_client)
+        anthropic_client.messages.create.side_effect = Exception("API also failed")
 
         with patch(
             "morning_report.french_gen.subprocess.run",
             side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300),
         ):
-            with patch.dict("sys.modules", {"anthropic": mock_mod}):
-                result = generate_french_content(
-                    WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                    backend="claude-code",
-                    date=datetime(2026, 3, 1),
-                )
+            result = generate_french_content(
+                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+                backend="claude-code",
+                date=datetime(2026, 3, 1),
+            )
 
         assert "_error" in result
         for key in _EXPECTED_KEYS:
             assert result[key] == _FALLBACK_MSG
 
-    def test_no_fallback_when_api_backend_selected(self):
+    def test_no_fallback_when_api_backend_selected(self, anthropic_client):
         """When backend='api' is explicitly selected, no fallback occurs."""
-        mock_client = MagicMock()
-        mock_client.messages.create.side_effect = Exception("API failed")
-        mock_mod = self._make_mock_anthropic(mock_client)
-
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            with patch("morning_report.french_gen.subprocess.run") as mock_run:
-                result = generate_french_content(
-                    WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                    api_key="test-key",
-                    backend="api",
-                )
+        anthropic_client.messages.create.side_effect = Exception("API failed")
+
+        with patch("morning_report.french_gen.subprocess.run") as mock_run:
+            result = generate_french_content(
+                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+                api_key="test-key",
+                backend="api",
+            )
 
         mock_run.assert_not_called()
         assert "_error" in result
 
 
+@pytest.mark.mock_anthropic
 class TestGenerateViaApi:
     """Tests for the api backend (anthropic SDK)."""
 
-    def _make_mock_response(self, content_dict, input_tokens=500, output_tokens=1500):
-        mock_response = MagicMock()
-        mock_block = MagicMock()
-        mock_block.type = "text"
-        mock_block.text = json.dumps(content_dict)
-        mock_response.content = [mock_block]
-        mock_response.usage.input_tokens = input_tokens
-        mock_response.usage.output_tokens = output_tokens
-        return mock_response
-
-    def _make_mock_anthropic(self, mock_client=None):
-        """Create a mock anthropic module with a working Anthropic class."""
-        mock_mod = MagicMock()
-        if mock_client:
-            mock_mod.Anthropic.return_value = mock_client
-        mock_mod.AuthenticationError = type("AuthenticationError", (Exception,), {})
-        return mock_mod
-
-    def test_successful_generation(self):
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(MOCK_API_RESPONSE)
-        mock_mod = self._make_mock_anthropic(mock_client)
+    def test_successful_generation(self, anthropic_client):
+        anthropic_client.messages.create.return_value = _make_mock_response()
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            result = generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                api_key="test-key",
-                backend="api",
-                date=datetime(2026, 3, 1),
-            )
+        result = generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            api_key="test-key",
+            backend="api",
+            date=datetime(2026, 3, 1),
+        )
 
         assert result["meditation_fr"] == MOCK_API_RESPONSE["meditation_fr"]
         assert "_error" not in result
@@ -489,115 +429,91 @@ class TestGenerateViaApi:
         assert result["_input_tokens"] == 500
         assert result["_output_tokens"] == 1500
 
-    def test_missing_keys_get_fallback(self):
+    def test_missing_keys_get_fallback(self, anthropic_client):
         partial_response = {"meditation_fr": "Translated text."}
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(partial_response)
-        mock_mod = self._make_mock_anthropic(mock_client)
+        anthropic_client.messages.create.return_value = _make_mock_response(partial_response)
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            result = generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                api_key="test-key",
-                backend="api",
-            )
+        result = generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            api_key="test-key",
+            backend="api",
+        )
 
         assert result["meditation_fr"] == "Translated text."
         for key in ("history", "vocabulary", "expression", "grammar", "exercise"):
             assert result[key] == _FALLBACK_MSG
 
-    def test_api_call_failure(self):
-        mock_client = MagicMock()
-        mock_client.messages.create.side_effect = Exception("API timeout")
-        mock_mod = self._make_mock_anthropic(mock_client)
+    def test_api_call_failure(self, anthropic_client):
+        anthropic_client.messages.create.side_effect = Exception("API timeout")
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            result = generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                api_key="test-key",
-                backend="api",
-            )
+        result = generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            api_key="test-key",
+            backend="api",
+        )
 
         assert "_error" in result
         assert "API timeout" in result["_error"]
         for key in _EXPECTED_KEYS:
             assert result[key] == _FALLBACK_MSG
 
-    def test_anthropic_not_installed(self):
-        # Temporarily remove anthropic from sys.modules if present
-        import sys
-        saved = sys.modules.pop("anthropic", None)
-        try:
-            with patch.dict("sys.modules", {"anthropic": None}):
-                result = generate_french_content(
-                    WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                    backend="api",
-                )
-        finally:
-            if saved is not None:
-                sys.modules["anthropic"] = saved
+    def test_anthropic_not_installed(self, monkeypatch):
+        # A None entry makes ``import anthropic`` raise ImportError
+        monkeypatch.setitem(sys.modules, "anthropic", None)
+        result = generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            backend="api",
+        )
 
         assert "_error" in result
         assert "not installed" in result["_error"]
 
-    def test_custom_model(self):
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(MOCK_API_RESPONSE)
-        mock_mod = self._make_mock_anthropic(mock_client)
+    def test_custom_model(self, anthropic_client):
+        anthropic_client.messages.create.return_value = _make_mock_response()
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                api_key="test-key",
-                backend="api",
-                model="claude-sonnet-4-5-20250514",
-            )
+        generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            api_key="test-key",
+            backend="api",
+            model="claude-sonnet-4-5-20250514",
+        )
 
-        call_kwargs = mock_client.messages.create.call_args.kwargs
+        call_kwargs = anthropic_client.messages.create.call_args.kwargs
         assert call_kwargs["model"] == "claude-sonnet-4-5-20250514"
 
-    def test_default_model_is_claude_sonnet(self):
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(MOCK_API_RESPONSE)
-        mock_mod = self._make_mock_anthropic(mock_client)
+    def test_default_model_is_claude_sonnet(self, anthropic_client):
+        anthropic_client.messages.create.return_value = _make_mock_response()
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                api_key="test-key",
-                backend="api",
-            )
+        generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            api_key="test-key",
+            backend="api",
+        )
 
-        call_kwargs = mock_client.messages.create.call_args.kwargs
+        call_kwargs = anthropic_client.messages.create.call_args.kwargs
         assert call_kwargs["model"] == "claude-sonnet-4-6"
 
-    def test_uses_configured_level(self):
-        mock_client = MagicMock()
-        mock_client.messages.create.return_value = self._make_mock_response(MOCK_API_RESPONSE)
-        mock_mod = self._make_mock_anthropic(mock_client)
+    def test_uses_configured_level(self, anthropic_client):
+        anthropic_client.messages.create.return_value = _make_mock_response()
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                level="A2",
-                api_key="test-key",
-                backend="api",
-            )
+        generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            level="A2",
+            api_key="test-key",
+            backend="api",
+        )
 
-        call_kwargs = mock_client.messages.create.call_args.kwargs
+        call_kwargs = anthropic_client.messages.create.call_args.kwargs
         assert "A2" in call_kwargs["system"]
 
-    def test_auth_error_handling(self):
-        mock_mod = MagicMock()
-        mock_mod.AuthenticationError = type("AuthenticationError", (Exception,), {})
-        mock_mod.Anthropic.side_effect = mock_mod.AuthenticationError("Invalid key")
+    def test_auth_error_handling(self, anthropic_mod):
+        anthropic_mod.Anthropic.side_effect = anthropic_mod.AuthenticationError("Invalid key")
 
-        with patch.dict("sys.modules", {"anthropic": mock_mod}):
-            result = generate_french_content(
-                WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
-                api_key="bad-key",
-                backend="api",
-            )
+        result = generate_french_content(
+            WEATHER_DATA, MARKETS_DATA, MEDITATION_DATA,
+            api_key="bad-key",
+            backend="api",
+        )
 
         assert "_error" in result
         assert "API key" in result["_error"]
@@ -615,8 +531,9 @@ class TestPoemStamping:
     }
 
     def _mock_proc(self, result_dict):
-        envelope = {"result": json.dumps(result_dict), "is_error": False}
-        return MagicMock(
+        envelope = {"result": json.dumps(thaw(result_dict)), "is_error": False}
+        return subprocess.CompletedProcess(
+            args=["claude"],
             returncode=0,
             stdout=json.dumps(envelope),
             stderr="",
@@ -1,92 +1,31 @@
 """Tests for French learning report generation."""
 
-from datetime import datetime
+import json
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from morning_report.report.generator import (
     generate_report,
+    generate_reports,
+    save_gathered_data,
     french_date,
     FRENCH_DAYS,
     FRENCH_MONTHS,
     WEATHER_FR,
     _weather_fr,
+    _french_day,
+    _template,
+    _environment,
+    _TEMPLATE_CACHE_ENV,
+    _TEMPLATE_CACHE,
+    _write_bytes,
 )
 
-
-# -- Shared test data --------------------------------------------------------
-
-SAMPLE_DATA = {
-    "weather": {
-        "status": "ok",
-        "locations": {
-            "West Kirby, UK": {
-                "current": {
-                    "description": "overcast clouds",
-                    "temp": 10.2,
-                    "feels_like": 8.5,
-                    "humidity": 82,
-                    "wind_speed": 5.1,
-                },
-            }
-        },
-    },
-    "markets": {
-        "status": "ok",
-        "crypto": {
-            "bitcoin": {"symbol": "BTC", "price_usd": 67943.50, "change_24h_pct": 2.3},
-            "ethereum": {"symbol": "ETH", "price_usd": 2045.20, "change_24h_pct": -1.1},
-        },
-        "stocks": {},
-    },
-    "meditation": {
-        "status": "ok",
-        "items": [
-            {
-                "title": "The Power of Letting Go",
-                "summary": "Today's meditation focuses on surrender.",
-                "content": "Richard Rohr reflects on the practice of letting go.",
-                "link": "http://cac.org/meditation",
-                "published": "2026-02-26",
-                "source": "Center for Action and Contemplation",
-            },
-        ],
-    },
-}
-
-SAMPLE_FRENCH_CONTENT = {
-    "meditation_fr": "Richard Rohr reflechit sur la pratique du lacher prise.",
-    "poem": {
-        "text": "La pluie tombe doucement\nSur les toits gris du matin",
-        "author": "Paul Verlaine",
-        "title": "Il pleure dans mon coeur",
-        "source": "Romances sans paroles (1874)",
-    },
-    "history": {
-        "year": 1872,
-        "text": "Le premier parc national, Yellowstone, a ete cree.",
-    },
-    "vocabulary": [
-        {"fr": "la pluie", "en": "rain", "example": "La pluie tombe sur la ville."},
-        {"fr": "le marche", "en": "market", "example": "Le marche est en hausse."},
-    ],
-    "expression": {
-        "fr": "Apres la pluie, le beau temps",
-        "en": "Every cloud has a silver lining",
-        "example": "Ne t'inquiete pas, apres la pluie, le beau temps !",
-    },
-    "grammar": {
-        "rule": "Le passe compose avec avoir",
-        "explanation": "Use avoir + past participle for most verbs.",
-        "examples": ["J'ai reflechi", "Il a lache prise"],
-    },
-    "exercise": {
-        "instruction": "Completez avec le mot correct :",
-        "questions": ["La ___ tombe doucement.", "Le ___ est en hausse."],
-        "answers": ["pluie", "marche"],
-    },
-}
+from ._fixtures import SAMPLE_DATA, SAMPLE_FRENCH_CONTENT, missing
 
 
 # -- French date helpers -----------------------------------------------------
@@ -99,158 +38,238 @@ class TestFrenchDateHelpers:
     def test_french_months_complete(self):
         assert set(FRENCH_MONTHS.keys()) == set(range(1, 13))
 
-    def test_french_date_formatting(self):
-        dt = datetime(2026, 2, 26)  # Thursday
-        result = french_date(dt)
-        assert result == "jeudi 26 fevrier 2026"
+    def test_french_date_every_weekday(self):
+        # 2026-02-23 is a Monday; walk the full week
+        for offset, day_name in enumerate(FRENCH_DAYS.values()):
+            dt = datetime(2026, 2, 23) + timedelta(days=offset)
+            assert french_date(dt).startswith(f"{day_name} ")
 
-    def test_french_date_january(self):
-        dt = datetime(2026, 1, 1)  # Thursday
-        result = french_date(dt)
-        assert result == "jeudi 1 janvier 2026"
+    @pytest.mark.parametrize("dt,expected", [
+        (datetime(2026, 2, 26), "jeudi 26 fevrier 2026"),
+        (datetime(2026, 1, 1), "jeudi 1 janvier 2026"),
+        (datetime(2025, 12, 25), "jeudi 25 decembre 2025"),
+    ], ids=["february", "january", "december"])
+    def test_french_date(self, dt, expected):
+        assert french_date(dt) == expected
 
-    def test_french_date_december(self):
-        dt = datetime(2025, 12, 25)  # Thursday
-        result = french_date(dt)
-        assert result == "jeudi 25 decembre 2025"
+    def test_french_date_cached_per_day(self):
+        _french_day.cache_clear()
+        french_date(datetime(2026, 2, 26, 7, 0, 0, 1))
+        french_date(datetime(2026, 2, 26, 7, 0, 0, 2))
+        assert _french_day.cache_info().hits == 1
 
 
 # -- Report generation -------------------------------------------------------
 
+@pytest.fixture
+def fresh_template_cache():
+    """Start with no compiled templates and discard any built during the test."""
+    _environment.cache_clear()
+    _TEMPLATE_CACHE.clear()
+    yield
+    _environment.cache_clear()
+    _TEMPLATE_CACHE.clear()
+
+
+# Title and sign-off, present whatever data the report is given
+REPORT_FRAME = ("Francais du jour", "bonne journee")
+
+SECTION_CASES = [
+    pytest.param(("Meteo", "humidite", "vent"), id="weather"),
+    pytest.param(("Marches", "Jeton", "Variation 24h"), id="markets"),
+    pytest.param(("Meditation du jour", "The Power of Letting Go"), id="meditation"),
+    pytest.param(("Poeme du jour", "pluie tombe doucement", "Paul Verlaine",
+                  "Il pleure dans mon coeur", "Romances sans paroles (1874)"), id="poem"),
+    pytest.param(("Ce jour dans l'histoire", "1872", "Yellowstone"), id="history"),
+    pytest.param(("Vocabulaire", "la pluie", "rain"), id="vocabulary"),
+    pytest.param(("Expression du jour", "Apres la pluie"), id="expression"),
+    pytest.param(("Point de grammaire", "passe compose"), id="grammar"),
+    pytest.param(("Exercice", "Completez", "Reponses"), id="exercise"),
+]
+
+
+@pytest.fixture(scope="module")
+def rendered_reports():
+    """Render the sample report once per module, with and without French content.
+
+    Nothing is written to disk; tests that check the output file still call
+    ``generate_report`` themselves.
+    """
+    return {
+        "full": generate_report(SAMPLE_DATA, date=datetime(2026, 2, 26),
+                                french_content=SAMPLE_FRENCH_CONTENT),
+        "nofr": generate_report(SAMPLE_DATA, date=datetime(2026, 2, 26), french_content={}),
+    }
+
+
 class TestReportGeneration:
-    def test_generates_french_report(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
+    def test_generates_french_report(self, rendered_reports):
+        report = rendered_reports["full"]
         assert "Francais du jour" in report
 
+    def test_no_output_dir_writes_nothing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        generate_report(SAMPLE_DATA, date=datetime(2026, 2, 26))
+        assert list(tmp_path.iterdir()) == []
+
     def test_report_filename(self, tmp_path):
         dt = datetime(2026, 2, 26)
         generate_report(SAMPLE_DATA, output_dir=tmp_path, date=dt,
                         french_content=SAMPLE_FRENCH_CONTENT)
         assert (tmp_path / "2026-02-26.md").exists()
 
-    def test_has_french_date(self, tmp_path):
-        dt = datetime(2026, 2, 26)
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path, date=dt,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
+    def test_has_french_date(self, rendered_reports):
+        report = rendered_reports["full"]
         assert "jeudi 26 fevrier 2026" in report
 
-    def test_weather_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Meteo" in report
-        assert "humidite" in report
-        assert "vent" in report
+    @pytest.mark.parametrize("substrings", SECTION_CASES)
+    def test_section_present(self, rendered_reports, substrings):
+        absent = missing(rendered_reports["full"], substrings)
+        assert not absent, absent
 
-    def test_weather_translated(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
+    def test_weather_translated(self, rendered_reports):
+        report = rendered_reports["full"]
         assert "ciel couvert" in report.lower()
 
-    def test_markets_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Marches" in report
-        assert "Jeton" in report
-        assert "Variation 24h" in report
-
-    def test_meditation_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Meditation du jour" in report
-        assert "The Power of Letting Go" in report
-
-    def test_meditation_french_translation(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
+    def test_meditation_french_translation(self, rendered_reports):
+        report = rendered_reports["full"]
         assert "lacher prise" in report
 
-    def test_meditation_fallback_to_english(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content={})
-        assert "Traduction indisponible" in report
-        assert "letting go" in report
-
-    def test_poem_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Poeme du jour" in report
-        assert "pluie tombe doucement" in report
-        assert "Paul Verlaine" in report
-        assert "Il pleure dans mon coeur" in report
-        assert "Romances sans paroles (1874)" in report
-
-    def test_history_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Ce jour dans l'histoire" in report
-        assert "1872" in report
-        assert "Yellowstone" in report
-
-    def test_vocabulary_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Vocabulaire" in report
-        assert "la pluie" in report
-        assert "rain" in report
-
-    def test_expression_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Expression du jour" in report
-        assert "Apres la pluie" in report
-
-    def test_grammar_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Point de grammaire" in report
-        assert "passe compose" in report
-
-    def test_exercise_section(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
-        assert "Exercice" in report
-        assert "Completez" in report
-        assert "Reponses" in report
-
-    def test_report_ends_correctly(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
+    def test_meditation_fallback_to_english(self, rendered_reports):
+        absent = missing(rendered_reports["nofr"], ("Traduction indisponible", "letting go"))
+        assert not absent, absent
+
+    def test_report_ends_correctly(self, rendered_reports):
+        report = rendered_reports["full"]
         assert "bonne journee" in report
 
-    def test_no_placeholder_sections(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path,
-                                 french_content=SAMPLE_FRENCH_CONTENT)
+    def test_no_placeholder_sections(self, rendered_reports):
+        report = rendered_reports["full"]
         assert "Section completee par le skill" not in report
 
-    def test_empty_data_graceful(self, tmp_path):
-        report = generate_report({}, output_dir=tmp_path, french_content={})
-        assert "Francais du jour" in report
-        assert "bonne journee" in report
+    def test_empty_data_graceful(self):
+        absent = missing(generate_report({}, french_content={}), REPORT_FRAME)
+        assert not absent, absent
+
+    def test_no_french_content_still_renders(self):
+        absent = missing(generate_report(SAMPLE_DATA), ("Francais du jour", "Meteo"))
+        assert not absent, absent
+
+    def test_generated_at_uses_single_clock_read(self, tmp_path):
+        fixed = datetime(2026, 2, 26, 7, 5)
+        with patch("morning_report.report.generator.datetime") as mock_dt:
+            mock_dt.now.return_value = fixed
+            report = generate_report({}, output_dir=tmp_path)
+        mock_dt.now.assert_called_once_with()
+        assert "07:05" in report
+        assert (tmp_path / "2026-02-26.md").exists()
 
-    def test_no_french_content_still_renders(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path)
+    def test_generate_reports_batch(self, tmp_path):
+        dates = [datetime(2026, 2, 23) + timedelta(days=i) for i in range(3)]
+        reports = generate_reports(
+            [(SAMPLE_DATA, d, SAMPLE_FRENCH_CONTENT) for d in dates], output_dir=tmp_path,
+        )
+        assert len(reports) == 3
+        assert "lundi 23 fevrier 2026" in reports[0]
+        assert "mercredi 25 fevrier 2026" in reports[2]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "2026-02-23.md", "2026-02-24.md", "2026-02-25.md",
+        ]
+
+    def test_generate_reports_matches_single(self, tmp_path):
+        dt = datetime(2026, 2, 26)
+        with patch("morning_report.report.generator.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2026, 2, 26, 7, 0)
+            single = generate_report(SAMPLE_DATA, date=dt, french_content=SAMPLE_FRENCH_CONTENT)
+            [batched] = generate_reports([(SAMPLE_DATA, dt, SAMPLE_FRENCH_CONTENT)])
+        assert batched == single
+
+    def test_template_compiled_once(self):
+        first = _template()
+        generate_report(SAMPLE_DATA)
+        generate_report({})
+        assert _template() is first
+
+    def test_renders_without_bytecode_cache(self, fresh_template_cache):
+        with patch("morning_report.report.generator.FileSystemBytecodeCache",
+                   side_effect=RuntimeError("unsafe cache dir")):
+            report = generate_report(SAMPLE_DATA)
         assert "Francais du jour" in report
-        assert "Meteo" in report
 
+    def test_bytecode_cache_dir_from_env(self, tmp_path, monkeypatch, fresh_template_cache):
+        monkeypatch.setenv(_TEMPLATE_CACHE_ENV, str(tmp_path / "jinja"))
+        generate_report(SAMPLE_DATA)
+        [cached] = (tmp_path / "jinja").iterdir()
+        assert cached.name.startswith("morning_report-")
 
-# -- Weather translation ---------------------------------------------------
+    def test_recompiles_when_template_changes(self, tmp_path, monkeypatch, fresh_template_cache):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        source = templates / "french_learning.md.j2"
+        source.write_text("v1 {{ date }}")
+        monkeypatch.setattr("morning_report.report.generator._TEMPLATES_DIR", templates)
 
-class TestWeatherTranslation:
-    def test_common_descriptions(self):
-        assert _weather_fr("overcast clouds") == "ciel couvert"
-        assert _weather_fr("light rain") == "pluie legere"
-        assert _weather_fr("clear sky") == "ciel degage"
-        assert _weather_fr("scattered clouds") == "nuages epars"
+        assert generate_report({}, date=datetime(2026, 2, 26)) == "v1 2026-02-26"
+        first = _template()
+        assert _template() is first
 
-    def test_case_insensitive(self):
-        assert _weather_fr("Overcast Clouds") == "ciel couvert"
-        assert _weather_fr("LIGHT RAIN") == "pluie legere"
+        source.write_text("v2 {{ date }}")
+        os.utime(source, ns=(0, source.stat().st_mtime_ns + 1_000_000))
+        assert generate_report({}, date=datetime(2026, 2, 26)) == "v2 2026-02-26"
 
-    def test_unknown_falls_back(self):
-        assert _weather_fr("volcanic ash") == "volcanic ash"
 
-    def test_weather_in_report(self, tmp_path):
-        report = generate_report(SAMPLE_DATA, output_dir=tmp_path)
+# -- Weather translation ---------------------------------------------------
+
+class TestWeatherTranslation:
+    @pytest.mark.parametrize("description,expected", [
+        ("overcast clouds", "ciel couvert"),
+        ("light rain", "pluie legere"),
+        ("clear sky", "ciel degage"),
+        ("scattered clouds", "nuages epars"),
+        ("Overcast Clouds", "ciel couvert"),
+        ("LIGHT RAIN", "pluie legere"),
+        ("volcanic ash", "volcanic ash"),
+    ])
+    def test_weather_fr(self, description, expected):
+        assert _weather_fr(description) == expected
+
+    def test_table_is_read_only(self):
+        with pytest.raises(TypeError):
+            WEATHER_FR["volcanic ash"] = "cendres"
+
+    def test_repeat_lookups_hit_cache(self):
+        _weather_fr.cache_clear()
+        _weather_fr("light rain")
+        _weather_fr("light rain")
+        assert _weather_fr.cache_info().hits == 1
+
+    def test_weather_in_report(self, rendered_reports):
+        report = rendered_reports["nofr"]
         assert "ciel couvert" in report.lower()
         assert "overcast clouds" not in report.lower()
+
+
+# -- Gathered data persistence ------------------------------------------------
+
+class TestSaveGatheredData:
+    def test_writes_dated_json(self, tmp_path, sample_data):
+        save_gathered_data(sample_data, tmp_path, date=datetime(2026, 2, 26))
+        saved = json.loads((tmp_path / "2026-02-26.json").read_text())
+        assert saved == sample_data
+
+    def test_overwrites_existing_file(self, tmp_path):
+        (tmp_path / "2026-02-26.json").write_text("x" * 10_000)
+        save_gathered_data({"a": 1}, tmp_path, date=datetime(2026, 2, 26))
+        assert json.loads((tmp_path / "2026-02-26.json").read_text()) == {"a": 1}
+
+
+def test_write_bytes_handles_partial_writes(tmp_path):
+    path = tmp_path / "out.bin"
+    real_write = os.write
+
+    # Simulate a short write: at most 3 bytes per os.write call
+    with patch("morning_report.report.generator.os.write",
+               side_effect=lambda fd, buf: real_write(fd, bytes(buf[:3]))):
+        _write_bytes(path, b"0123456789")
+
+    assert path.read_bytes() == b"0123456789"
@@ -0,0 +1,96 @@
+"""Tests for the JSON encoding helpers."""
+
+import json
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pytest
+
+from morning_report import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both the orjson fast path and the stdlib fallback."""
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+class TestDumps:
+    def test_returns_bytes(self, backend):
+        assert isinstance(jsonio.dumps({"a": 1}), bytes)
+
+    def test_round_trip(self, backend):
+        data = {"weather": {"status": "ok", "temp": 11.5, "items": [1, 2, 3]}}
+        assert json.loads(jsonio.dumps(data)) == data
+
+    def test_indented(self, backend):
+        assert jsonio.dumps({"a": 1}) == b'{\n  "a": 1\n}'
+
+    def test_datetime_uses_isoformat(self, backend):
+        dt = datetime(2026, 2, 26, 5, 0)
+        assert json.loads(jsonio.dumps({"at": dt})) == {"at": "2026-02-26T05:00:00"}
+
+    def test_aware_datetime_and_date(self, backend):
+        data = {
+            "at": datetime(2026, 2, 26, 5, 0, 0, 250, tzinfo=UTC),
+            "on": date(2026, 2, 26),
+        }
+        assert json.loads(jsonio.dumps(data)) == {
+            "at": "2026-02-26T05:00:00.000250+00:00",
+            "on": "2026-02-26",
+        }
+
+    def test_other_values_use_str(self, backend):
+        assert json.loads(jsonio.dumps({"p": Path("briefings/x.md")})) == {"p": "briefings/x.md"}
+
+    def test_non_string_keys(self, backend):
+        assert json.loads(jsonio.dumps({1: "a"})) == {"1": "a"}
+
+    def test_unicode_written_as_utf8(self, backend):
+        assert "ciel dégagé".encode() in jsonio.dumps({"d": "ciel dégagé"})
+
+
+class TestLoads:
+    def test_parses_bytes(self, backend):
+        assert jsonio.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_parses_str(self, backend):
+        assert jsonio.loads('{"a": "b"}') == {"a": "b"}
+
+    def test_round_trips_dumps(self, backend):
+        data = {"markets": {"crypto": {"bitcoin": {"price_usd": 65432.1}}}}
+        assert jsonio.loads(jsonio.dumps(data)) == data
+
+    def test_invalid_raises_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"not json")
+
+
+class TestLoadFile:
+    def test_parses_file(self, backend, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_bytes(b'{"a": [1, 2]}')
+        assert jsonio.load_file(path) == {"a": [1, 2]}
+
+    def test_large_file_matches_loads(self, backend, tmp_path):
+        papers = [{"title": f"Paper {i}", "tier": i % 3} for i in range(100_000)]
+        data = {"arxiv": {"papers": papers}}
+        path = tmp_path / "data.json"
+        path.write_bytes(jsonio.dumps(data))
+        assert path.stat().st_size > 5_000_000
+        assert jsonio.load_file(path) == jsonio.loads(path.read_bytes())
+
+    def test_empty_file_raises_json_decode_error(self, backend, tmp_path):
+        path = tmp_path / "empty.json"
+        path.touch()
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.load_file(path)
+
+    def test_missing_file_raises(self, backend, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            jsonio.load_file(tmp_path / "missing.json")
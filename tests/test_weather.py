@@ -1,10 +1,35 @@
 """Tests for the Weather gatherer."""
 
-from unittest.mock import patch, MagicMock
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
-from morning_report.gatherers.weather import WeatherGatherer, _get_coords
+from morning_report.gatherers import weather
+from morning_report.gatherers.weather import (
+    WeatherGatherer, _CoordsCache, _get_coords, _lookup_coords, _remember_coords,
+)
+
+from ._fakes import fake_response
+
+
+@pytest.fixture(autouse=True)
+def _clear_coords_cache():
+    _lookup_coords.cache_clear()
+    yield
+    _lookup_coords.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def coords_cache(tmp_path, monkeypatch):
+    """Point the persistent geocode cache at a per-test database."""
+    cache = _CoordsCache(tmp_path / "geocode.db")
+    monkeypatch.setattr(weather, "_COORDS_CACHE", cache)
+    monkeypatch.setattr(weather, "_RESPONSE_CACHE_PATH", tmp_path / "owm")
+    return cache
 
 
 class TestGetCoords:
@@ -16,10 +41,68 @@ class TestGetCoords:
         coords = _get_coords("WEST KIRBY, UK")
         assert coords == (53.3726, -3.1836)
 
+    def test_casefolded_key(self, coords_cache):
+        coords_cache.put("strasse", 1.0, 2.0)
+        assert _get_coords("STRASSE") == (1.0, 2.0)
+        assert _get_coords("Straße") == (1.0, 2.0)
+
+    def test_table_is_read_only(self):
+        with pytest.raises(TypeError):
+            weather._KNOWN_COORDS["paris, fr"] = (48.8566, 2.3522)
+
     def test_unknown_location(self):
         coords = _get_coords("Unknown City, Mars")
         assert coords is None
 
+    def test_falls_back_to_persistent_cache(self, coords_cache):
+        coords_cache.put("lyon, fr", 45.7640, 4.8357)
+        assert _get_coords("Lyon, FR") == (45.7640, 4.8357)
+
+    def test_variants_share_one_cached_lookup(self):
+        _get_coords("West Kirby, UK")
+        _get_coords("  west kirby, uk ")
+        info = _lookup_coords.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
+class TestCoordsCache:
+    def test_persists_across_instances(self, tmp_path):
+        _CoordsCache(tmp_path / "geo.db").put("lyon, fr", 45.7640, 4.8357)
+        assert _CoordsCache(tmp_path / "geo.db").get("lyon, fr") == (45.7640, 4.8357)
+
+    def test_miss_returns_none(self, coords_cache):
+        assert coords_cache.get("nowhere") is None
+
+    def test_unusable_path_degrades_to_miss(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = _CoordsCache(blocker / "geo.db")
+        cache.put("lyon, fr", 45.7640, 4.8357)
+        assert cache.get("lyon, fr") is None
+
+    def test_gather_learns_coords_from_response(self, coords_cache, owm_stub):
+        owm_stub.payloads["weather"] = {"coord": {"lat": 45.76, "lon": 4.84}, "main": {}}
+        g = WeatherGatherer(config={"api_key": "k", "locations": ["Lyon, FR"], "one_call": True})
+        g.gather()
+        assert coords_cache.get("lyon, fr") == (45.76, 4.84)
+        assert _get_coords("Lyon, FR") == (45.76, 4.84)
+
+    def test_default_run_does_not_touch_cache(self, tmp_path, owm_stub):
+        owm_stub.payloads["weather"] = {"coord": {"lat": 45.76, "lon": 4.84}, "main": {}}
+        WeatherGatherer(config={"api_key": "k", "locations": ["Lyon, FR"]}).gather()
+        assert not (tmp_path / "geocode.db").exists()
+
+    def test_unknown_location_read_from_disk_once(self, coords_cache, monkeypatch):
+        reads = []
+        monkeypatch.setattr(coords_cache, "get", lambda key: reads.append(key))
+        assert _get_coords("Lyon, FR") is None
+        assert _get_coords("lyon, fr") is None
+        assert reads == ["lyon, fr"]
+
+    def test_known_location_not_written(self, coords_cache):
+        _remember_coords("West Kirby, UK", {"coord": {"lat": 1.0, "lon": 2.0}})
+        assert coords_cache.get("west kirby, uk") is None
+
 
 class TestWeatherGatherer:
     def test_name(self):
@@ -38,17 +121,18 @@ class TestWeatherGatherer:
         g = WeatherGatherer(config={"api_key": "real-key-123"})
         assert g.is_available()
 
-    def test_gather_current_weather(self):
-        mock_current = MagicMock()
-        mock_current.json.return_value = {
+    def test_is_available_decided_at_init(self):
+        g = WeatherGatherer(config={"api_key": "real-key-123"})
+        g._api_key = "${OPENWEATHER_API_KEY}"
+        assert g.is_available()
+
+    def test_gather_current_weather(self, owm_stub):
+        owm_stub.payloads["weather"] = {
             "weather": [{"description": "scattered clouds"}],
             "main": {"temp": 12.5, "feels_like": 10.2, "humidity": 78},
             "wind": {"speed": 5.4},
         }
-        mock_current.raise_for_status = MagicMock()
-
-        mock_forecast = MagicMock()
-        mock_forecast.json.return_value = {
+        owm_stub.payloads["forecast"] = {
             "list": [
                 {
                     "dt_txt": "2026-02-25 12:00:00",
@@ -62,19 +146,12 @@ class TestWeatherGatherer:
                 },
             ],
         }
-        mock_forecast.raise_for_status = MagicMock()
 
-        def mock_get(url, **kwargs):
-            if "forecast" in url:
-                return mock_forecast
-            return mock_current
-
-        with patch("morning_report.gatherers.weather.requests.get", side_effect=mock_get):
-            g = WeatherGatherer(config={
-                "api_key": "test-key",
-                "locations": ["West Kirby, UK"],
-            })
-            result = g.gather()
+        g = WeatherGatherer(config={
+            "api_key": "test-key",
+            "locations": ["West Kirby, UK"],
+        })
+        result = g.gather()
 
         loc = result["locations"]["West Kirby, UK"]
         assert loc["current"]["description"] == "scattered clouds"
@@ -83,38 +160,231 @@ class TestWeatherGatherer:
         assert len(loc["forecast"]) == 2
         assert loc["forecast"][0]["description"] == "light rain"
 
-    def test_gather_always_uses_q_param(self):
+    def test_gather_always_uses_q_param(self, owm_stub):
         """Free-tier OWM doesn't support lat/lon — always use q= for location."""
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        owm_stub.payloads["weather"] = {
             "weather": [{"description": "clear"}],
             "main": {"temp": 15, "feels_like": 14, "humidity": 60},
             "wind": {"speed": 3},
         }
-        mock_resp.raise_for_status = MagicMock()
+        owm_stub.payloads["forecast"] = {"list": []}
 
-        mock_forecast = MagicMock()
-        mock_forecast.json.return_value = {"list": []}
-        mock_forecast.raise_for_status = MagicMock()
+        g = WeatherGatherer(config={
+            "api_key": "test-key",
+            "locations": ["West Kirby, UK"],
+        })
+        g.gather()
 
-        calls = []
+        assert owm_stub.endpoints() == ["forecast", "weather"]
+        for _, params in owm_stub.calls:
+            assert params["q"] == "West Kirby, UK"
+            assert "lat" not in params
 
-        def mock_get(url, **kwargs):
-            calls.append(kwargs.get("params", {}))
-            if "forecast" in url:
-                return mock_forecast
-            return mock_resp
+    def test_requests_issued_concurrently(self):
+        # Both locations' current + forecast calls wait on each other
+        barrier = threading.Barrier(4, timeout=5)
 
-        with patch("morning_report.gatherers.weather.requests.get", side_effect=mock_get):
+        def mock_get(url, params, **kwargs):
+            barrier.wait()
+            return fake_response(
+                {"list": []} if "forecast" in url
+                else {"weather": [{"description": params["q"]}], "main": {}}
+            )
+
+        with patch("morning_report.gatherers.weather.requests.Session.get", side_effect=mock_get):
             g = WeatherGatherer(config={
                 "api_key": "test-key",
-                "locations": ["West Kirby, UK"],
+                "locations": ["Lyon, FR", "Paris, FR"],
             })
+            result = g.gather()
+
+        assert list(result["locations"]) == ["Lyon, FR", "Paris, FR"]
+        assert result["locations"]["Paris, FR"]["current"]["description"] == "Paris, FR"
+
+    def test_session_reused_across_requests(self):
+        resp = fake_response({"main": {}, "list": []})
+        g = WeatherGatherer(config={"api_key": "test-key", "locations": ["Lyon, FR", "Paris, FR"]})
+        with patch.object(g._session, "get", return_value=resp) as mock_get:
             g.gather()
+        assert mock_get.call_count == 4
+
+    def test_session_retries_gateway_errors(self):
+        adapter = WeatherGatherer()._session.get_adapter("https://api.openweathermap.org")
+        assert adapter.max_retries.total == 2
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_context_manager_closes_session(self):
+        g = WeatherGatherer()
+        with patch.object(g._session, "close") as mock_close:
+            with g:
+                pass
+        mock_close.assert_called_once()
+
+    def test_session_created_on_first_use(self, monkeypatch):
+        created = []
 
-        assert "q" in calls[0]
-        assert calls[0]["q"] == "West Kirby, UK"
-        assert "lat" not in calls[0]
+        def make_session():
+            created.append(1)
+            return requests.Session()
+
+        monkeypatch.setattr(weather, "_owm_session", make_session)
+        g = WeatherGatherer()
+        assert created == []
+        session = g._session
+        assert g._session is session
+        assert created == [1]
+
+    def test_one_session_per_gather(self, monkeypatch, owm_stub):
+        created = []
+
+        def make_session():
+            created.append(1)
+            return requests.Session()
+
+        monkeypatch.setattr(weather, "_owm_session", make_session)
+        g = WeatherGatherer(config={
+            "api_key": "k", "locations": ["Lyon, FR", "Paris, FR", "Nice, FR", "Lille, FR"],
+        })
+        g.gather()
+
+        assert len(owm_stub.calls) == 8
+        assert created == [1]
+
+    def test_close_without_session_is_noop(self, monkeypatch):
+        monkeypatch.setattr(weather, "_owm_session", lambda: pytest.fail("session created"))
+        with WeatherGatherer():
+            pass
+
+    def test_plain_session_without_requests_cache(self, monkeypatch):
+        monkeypatch.setattr(weather, "requests_cache", None)
+        assert type(WeatherGatherer()._session) is requests.Session
+
+    def test_cached_session_when_requests_cache_installed(self, monkeypatch, tmp_path):
+        class CachedSession(requests.Session):
+            def __init__(self, cache_name, **kwargs):
+                super().__init__()
+                self.cache_name, self.kwargs = cache_name, kwargs
+
+        monkeypatch.setattr(weather, "requests_cache", SimpleNamespace(CachedSession=CachedSession))
+        session = WeatherGatherer()._session
+
+        assert isinstance(session, CachedSession)
+        assert session.cache_name == str(tmp_path / "owm")
+        assert session.kwargs["expire_after"] == 600
+        assert session.kwargs["stale_if_error"] == 3600
+        assert session.kwargs["ignored_parameters"] == ["appid"]
+        assert isinstance(session.get_adapter("https://api.openweathermap.org"), HTTPAdapter)
+
+    def test_response_body_parsed_with_jsonio(self, monkeypatch, owm_stub):
+        parsed = []
+        def loads(body):
+            parsed.append(body)
+            return {"main": {"temp": 4}}
+
+        monkeypatch.setattr(weather.jsonio, "loads", loads)
+        owm_stub.payloads["weather"] = {"main": {"temp": 4}}
+        g = WeatherGatherer(config={
+            "api_key": "k", "locations": ["Lyon, FR"], "include_forecast": False,
+        })
+        result = g.gather()
+
+        assert parsed == [b'{"main": {"temp": 4}}']
+        assert result["locations"]["Lyon, FR"]["current"]["temp"] == 4
+
+    def test_gather_deduplicates_locations(self, owm_stub):
+        g = WeatherGatherer(config={
+            "api_key": "k", "locations": ["Lyon, FR", "Paris, FR", "Lyon, FR"],
+        })
+        result = g.gather()
+
+        assert len(owm_stub.calls) == 4
+        assert list(result["locations"]) == ["Lyon, FR", "Paris, FR"]
+
+    def test_no_locations(self):
+        g = WeatherGatherer(config={"api_key": "test-key", "locations": []})
+        assert g.gather() == {"locations": {}}
+
+    def test_one_call_single_request_for_known_location(self, owm_stub):
+        owm_stub.payloads["onecall"] = {
+            "current": {"temp": 9.5, "feels_like": 7.0, "humidity": 90, "wind_speed": 6.2,
+                        "weather": [{"description": "light rain"}]},
+            "hourly": [
+                {
+                    "dt": 1772020800 + h * 3600,
+                    "temp": 9.0 + h,
+                    "weather": [{"description": "drizzle"}],
+                }
+                for h in range(48)
+            ],
+        }
+        g = WeatherGatherer(config={
+            "api_key": "k", "locations": ["West Kirby, UK"], "one_call": True,
+        })
+        result = g.gather()
+
+        [(endpoint, params)] = owm_stub.calls
+        assert endpoint == "onecall"
+        assert (params["lat"], params["lon"]) == (53.3726, -3.1836)
+        loc = result["locations"]["West Kirby, UK"]
+        assert loc["current"] == {"description": "light rain", "temp": 9.5, "feels_like": 7.0,
+                                  "humidity": 90, "wind_speed": 6.2}
+        assert len(loc["forecast"]) == 8
+        assert loc["forecast"][0] == {
+            "time": "2026-02-25 12:00:00", "description": "drizzle", "temp": 9.0,
+        }
+        assert loc["forecast"][1]["temp"] == 12.0
+
+    def test_one_call_unknown_location_uses_q_pair(self, owm_stub):
+        g = WeatherGatherer(config={"api_key": "k", "locations": ["Lyon, FR"], "one_call": True})
+        g.gather()
+
+        assert owm_stub.endpoints() == ["forecast", "weather"]
+        assert all(p["q"] == "Lyon, FR" and "lat" not in p for _, p in owm_stub.calls)
+
+    def test_every_request_carries_key_and_units(self, owm_stub):
+        g = WeatherGatherer(config={"api_key": "k", "locations": ["Lyon, FR", "Paris, FR"]})
+        g.gather()
+
+        assert all(p["appid"] == "k" and p["units"] == "metric" for _, p in owm_stub.calls)
+        assert g._base_params == {"appid": "k", "units": "metric"}
+
+    def test_forecast_requests_only_next_24h(self, owm_stub):
+        WeatherGatherer(config={"api_key": "k", "locations": ["Lyon, FR"]}).gather()
+
+        params = dict(owm_stub.calls)
+        assert params["forecast"]["cnt"] == 8
+        assert "cnt" not in params["weather"]
+
+    def test_forecast_not_fetched_when_disabled(self, owm_stub):
+        owm_stub.payloads["weather"] = {
+            "weather": [{"description": "clear sky"}],
+            "main": {"temp": 15},
+        }
+        g = WeatherGatherer(config={"api_key": "k", "locations": ["Lyon, FR", "Paris, FR"],
+                                    "include_forecast": False})
+        result = g.gather()
+
+        assert owm_stub.endpoints() == ["weather", "weather"]
+        assert "forecast" not in result["locations"]["Lyon, FR"]
+        assert result["locations"]["Lyon, FR"]["current"]["description"] == "clear sky"
+
+    def test_one_call_excludes_hourly_when_forecast_disabled(self, owm_stub):
+        owm_stub.payloads["onecall"] = {"current": {"temp": 9.5}}
+        g = WeatherGatherer(config={"api_key": "k", "locations": ["West Kirby, UK"],
+                                    "one_call": True, "include_forecast": False})
+        result = g.gather()
+
+        [(_, params)] = owm_stub.calls
+        assert params["exclude"] == "minutely,daily,alerts,hourly"
+        assert result["locations"]["West Kirby, UK"] == {
+            "current": {
+                "description": "",
+                "temp": 9.5,
+                "feels_like": None,
+                "humidity": None,
+                "wind_speed": None,
+            },
+        }
 
     def test_safe_gather_skipped_without_key(self):
         g = WeatherGatherer(config={"api_key": ""})
@@ -123,7 +393,8 @@ class TestWeatherGatherer:
 
     def test_gather_handles_api_error_per_location(self):
         """When API fails for a location, that location gets an error dict but gather still succeeds."""
-        with patch("morning_report.gatherers.weather.requests.get", side_effect=Exception("timeout")):
+        with patch("morning_report.gatherers.weather.requests.Session.get",
+                   side_effect=Exception("timeout")):
             g = WeatherGatherer(config={
                 "api_key": "test-key",
                 "locations": ["West Kirby, UK"],